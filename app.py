@@ -1,150 +1,527 @@
-import os, json, requests
-from openai import OpenAI
-from dataclasses import dataclass
+import os, re, sys, json, time, random, asyncio, hashlib, functools, multiprocessing, httpx
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from openai import AsyncOpenAI, OpenAIError
+from dataclasses import dataclass, fields
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+try: from orjson import loads as json_loads  # C decoder, several times faster on large market pages
+except ImportError: json_loads = json.loads
+try: import h2  # enables HTTP/2 multiplexing on the shared httpx client
+except ImportError: h2 = None
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     ticker: str; title: str; category: str; tags: List[str]
     yes_bid: float; yes_ask: float; no_bid: float; no_ask: float
     volume: int; volume_24h: int; open_interest: int; last_price: float
 
+if hasattr(np, "bitwise_count"): popcount = np.bitwise_count
+else:
+    _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+    def popcount(words): return _POPCOUNT_TABLE[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1)
+
+# Series groups at least this large are scored in worker processes; smaller ones are cheaper than the pickling round-trip
+PROCESS_POOL_MIN_GROUP = 200
+# Candidate pairs of a series are enumerated and pruned this many at a time, so large series never materialize all n² pairs
+SCORING_PAIR_BLOCK = 1 << 20
+SCORING_COLUMNS = ["tag_set", "title_tokens", "category", "series", "last_price"]
+_score_pool = None
+
+def score_pool():
+    # Spawned, not forked: the pool starts inside the event loop after default-executor threads exist, and forking those can deadlock
+    global _score_pool
+    if _score_pool is None: _score_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn"))
+    return _score_pool
+
+def shutdown_score_pool():
+    global _score_pool
+    if _score_pool is not None: _score_pool.shutdown(); _score_pool = None
+
+MARKET_FIELDS = [f.name for f in fields(MarketData)]
+# Pairs also carry each market's category as listed, before series metadata fills blanks, for tag filtering
+PAIR_FIELDS = MARKET_FIELDS + ["raw_category"]
+NUMERIC_MARKET_FIELDS = ["yes_bid", "yes_ask", "no_bid", "no_ask", "volume", "volume_24h", "open_interest", "last_price"]
+INTEGER_MARKET_FIELDS = ["volume", "volume_24h", "open_interest"]
+
 @dataclass
 class ArbitrageOpportunity:
     description: str; markets: List[MarketData]; potential_profit: float; risk_level: str; confidence_score: float
 
 class KalshiAPIClient:
     BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
-    def __init__(self, api_key=None):
+    MARKETS_TTL = 60
+    SERIES_TTL = 24 * 3600
+    # Outbound shaping: concurrent requests, token-bucket rate (requests/second) and retries on throttling or transient failures
+    MAX_CONCURRENCY = 10
+    RATE_LIMIT = 20
+    MAX_ATTEMPTS = 5
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    # Market-page cursors change between crawls, so cached responses are capped to the newest CACHE_MAX_FILES,
+    # checked every CACHE_PRUNE_INTERVAL writes rather than on each one
+    CACHE_MAX_FILES = 2048
+    CACHE_PRUNE_INTERVAL = 256
+    def __init__(self, api_key=None, session=None, cache_dir=".kalshi_cache"):
         self.api_key = api_key or os.getenv("KALSHI_API_KEY")
-        self.session = requests.Session()
-        if self.api_key: self.session.headers.update({"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"})
+        self.headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"} if self.api_key else {}
+        self._session, self._owns_session = session, session is None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        self._tokens, self._refilled = float(self.RATE_LIMIT), time.monotonic()
+        self._cache_writes = 0
+
+    @property
+    def session(self):
+        # Built lazily so the pooled client binds to the running event loop
+        if self._session is None: self._session = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_connections=50, keepalive_expiry=60))
+        return self._session
+
+    async def aclose(self):
+        if self._owns_session and self._session is not None: await self._session.aclose(); self._session = None
+
+    async def _acquire_token(self):
+        while True:
+            now = time.monotonic()
+            self._tokens, self._refilled = min(self.RATE_LIMIT, self._tokens + (now - self._refilled) * self.RATE_LIMIT), now
+            if self._tokens >= 1: self._tokens -= 1; return
+            await asyncio.sleep((1 - self._tokens) / self.RATE_LIMIT)
+
+    async def _send(self, url, params, headers):
+        for attempt in range(self.MAX_ATTEMPTS):
+            last = attempt == self.MAX_ATTEMPTS - 1
+            async with self._semaphore:
+                await self._acquire_token()
+                try:
+                    response = await self.session.get(url, params=params, headers=headers)
+                    if last or response.status_code not in self.RETRY_STATUSES: return response
+                except httpx.TransportError:
+                    if last: raise
+            # Exponential backoff with full jitter so throttled callers don't retry in lockstep
+            await asyncio.sleep(random.uniform(0, min(5.0, 0.2 * 2 ** attempt)))
+
+    async def _get(self, url, params=None, ttl=0):
+        # Responses are kept on disk per URL; fresh entries skip the network, stale ones are revalidated with their ETag
+        path = self.cache_dir / f"{hashlib.sha256(json.dumps([url, params], sort_keys=True).encode()).hexdigest()}.json" if self.cache_dir else None
+        try: entry = json.loads(path.read_text()) if path else None
+        except (OSError, ValueError): entry = None
+        if entry and time.time() - entry.get("created", 0) <= ttl: return entry["value"]
+        headers = {**self.headers, "If-None-Match": entry["etag"]} if entry and entry.get("etag") else self.headers
+        response = await self._send(url, params, headers)
+        if response.status_code == 304 and entry: value = entry["value"]
+        else:
+            response.raise_for_status()
+            value = json_loads(response.content)
+        etag = response.headers.get("etag") or (entry or {}).get("etag")
+        if path and (etag or ttl):
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps({"created": time.time(), "etag": etag, "value": value}))
+            except OSError: pass
+            else:
+                if self._cache_writes % self.CACHE_PRUNE_INTERVAL == 0: self._prune_cache()
+                self._cache_writes += 1
+        return value
 
-    def get_markets(self, limit=100, cursor=None, series_ticker=None, status="active"):
-        url = f"{self.BASE_URL}/markets"
+    def _prune_cache(self):
+        # Oldest written first; reads don't touch mtime, so an entry's age is its last fetch or revalidation
+        try:
+            entries = sorted(((p.stat().st_mtime, p) for p in self.cache_dir.glob("*.json")), key=lambda e: e[0])
+            for _, stale in entries[:-self.CACHE_MAX_FILES]: stale.unlink(missing_ok=True)
+        except OSError: pass
+
+    async def get_markets_page(self, limit=100, cursor=None, series_ticker=None, status="active"):
         params = {"limit": limit, "status": status}
         if cursor: params["cursor"] = cursor
         if series_ticker: params["series_ticker"] = series_ticker
-        response = self.session.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get(f"{self.BASE_URL}/markets", params, self.MARKETS_TTL)
+
+    async def iter_market_pages(self, series_ticker=None, limit=500, status="active"):
+        # Each cursor is only known once the previous page returns, so a single listing is walked in order
+        cursor = None
+        while True:
+            page = await self.get_markets_page(limit, cursor, series_ticker, status)
+            yield page
+            cursor = page.get("cursor")
+            if not cursor: return
+
+    async def get_all_markets(self, series_tickers=None, limit=500, status="active"):
+        # Separate series listings are independent cursor chains and are crawled concurrently
+        async def crawl(series_ticker):
+            return [m async for page in self.iter_market_pages(series_ticker, limit, status) for m in page.get("markets", [])]
+        chains = await asyncio.gather(*[crawl(s) for s in (series_tickers or [None])])
+        return {"markets": [m for chain in chains for m in chain]}
 
-    def get_series(self, ticker=None):
-        url = f"{self.BASE_URL}/series/{ticker}" if ticker else f"{self.BASE_URL}/series"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+    async def get_series(self, ticker=None):
+        return await self._get(f"{self.BASE_URL}/series/{ticker}" if ticker else f"{self.BASE_URL}/series", ttl=self.SERIES_TTL)
 
 class OpenAITagGenerator:
-    def __init__(self, api_key=None):
+    MODEL = "gpt-4o-mini"
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    CACHE_TTL = 24 * 3600
+    SEMANTIC_TTL = 3600
+    SIMILARITY_THRESHOLD = 0.92
+    # In-memory LRU in front of the on-disk cache; entries carry their creation time so CACHE_TTL holds for memory hits too
+    MEMORY_CACHE_SIZE = 256
+    def __init__(self, api_key=None, cache_dir=".llm_cache", http_client=None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key: raise ValueError("OpenAI API key required")
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(api_key=self.api_key, http_client=http_client, max_retries=5)
+        self.cache_dir = Path(cache_dir)
+        self._memory_cache = OrderedDict()
+        self._semantic_index = None
+
+    def _cache_key(self, prompt, num_tags):
+        return hashlib.sha256(json.dumps({"model": self.MODEL, "prompt": prompt, "n": num_tags}, sort_keys=True).encode()).hexdigest()
+
+    def _remember(self, key, created, value):
+        self._memory_cache[key] = (created, value)
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > self.MEMORY_CACHE_SIZE: self._memory_cache.popitem(last=False)
+
+    def _cache_get(self, key):
+        if (hit := self._memory_cache.get(key)) is not None:
+            if time.time() - hit[0] <= self.CACHE_TTL:
+                self._memory_cache.move_to_end(key)
+                return hit[1]
+            del self._memory_cache[key]
+        try: entry = json.loads((self.cache_dir / f"{key}.json").read_text())
+        except (OSError, ValueError): return None
+        created = entry.get("created", 0)
+        if time.time() - created > self.CACHE_TTL: return None
+        self._remember(key, created, entry["value"])
+        return entry["value"]
+
+    def _cache_set(self, key, value):
+        created = time.time()
+        self._remember(key, created, value)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.json").write_text(json.dumps({"created": created, "value": value}))
+        except OSError: pass
+
+    async def _embed(self, text):
+        key = hashlib.sha256(f"{self.EMBEDDING_MODEL}|{text}".encode()).hexdigest()
+        if (cached := self._cache_get(key)) is None:
+            try: cached = (await self.client.embeddings.create(model=self.EMBEDDING_MODEL, input=text)).data[0].embedding
+            except OpenAIError: return None
+            self._cache_set(key, cached)
+        return np.asarray(cached, dtype=np.float32)
+
+    def _load_semantic_index(self):
+        if self._semantic_index is None:
+            try: self._semantic_index = json.loads((self.cache_dir / "semantic_index.json").read_text())
+            except (OSError, ValueError): self._semantic_index = []
+        return self._semantic_index
+
+    def _semantic_lookup(self, embedding, num_tags):
+        now = time.time()
+        entries = [e for e in self._load_semantic_index() if e["n"] == num_tags and now - e["created"] <= self.SEMANTIC_TTL]
+        if not entries: return None
+        matrix = np.asarray([e["embedding"] for e in entries], dtype=np.float32)
+        similarity = matrix @ embedding / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(embedding) + 1e-12)
+        best = int(np.argmax(similarity))
+        return entries[best]["tags"] if similarity[best] >= self.SIMILARITY_THRESHOLD else None
 
-    def generate_arbitrage_tags(self, context="", num_tags=10):
+    def _semantic_store(self, embedding, num_tags, tags):
+        now = time.time()
+        index = [e for e in self._load_semantic_index() if now - e["created"] <= self.SEMANTIC_TTL]
+        index.append({"n": num_tags, "embedding": embedding.tolist(), "tags": tags, "created": now})
+        self._semantic_index = index
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / "semantic_index.json").write_text(json.dumps(index))
+        except OSError: pass
+
+    async def generate_arbitrage_tags(self, context="", num_tags=10, temperature=0):
         prompt = f"Generate {num_tags} relevant tags for finding arbitrage opportunities in election prediction markets. {f'Context: {context}' if context else ''} Return only JSON array."
-        response = self.client.chat.completions.create(model="gpt-4o-mini", messages=[{"role": "user", "content": prompt}], temperature=0.7, max_tokens=500)
+        # Only deterministic (temperature 0) completions are reusable across calls
+        key = self._cache_key(prompt, num_tags) if temperature == 0 else None
+        if key and (cached := self._cache_get(key)) is not None: return cached
+        # Paraphrased contexts land on the same tags: reuse a recent answer whose context embedding is close enough
+        embedding = await self._embed(context) if key and context else None
+        if embedding is not None and (similar := self._semantic_lookup(embedding, num_tags)) is not None:
+            self._cache_set(key, similar)
+            return similar
+        response = await self.client.chat.completions.create(model=self.MODEL, messages=[{"role": "user", "content": prompt}], temperature=temperature, max_tokens=500)
         result = response.choices[0].message.content.strip()
-        try: return json.loads(result)
-        except: return [line.strip('"') for line in result.split('\n') if '"' in line][:num_tags]
+        try: tags = json.loads(result)
+        except ValueError: tags = [line.strip('"') for line in result.split('\n') if '"' in line][:num_tags]
+        if key and tags:
+            self._cache_set(key, tags)
+            if embedding is not None: self._semantic_store(embedding, num_tags, tags)
+        return tags
 
 class ArbitrageDetector:
+    # A pair is only an opportunity when buying both sides costs less than this
+    MAX_PRICE_SUM = 0.95
     def __init__(self, kalshi_client, tag_generator):
         self.kalshi_client = kalshi_client
         self.tag_generator = tag_generator
 
-    def find_correlated_markets(self, tags=None, min_correlation_threshold=0.6):
-        markets_data = self.kalshi_client.get_markets(limit=500)
-        markets = [MarketData(ticker=m["ticker"], title=m["title"], category=m["category"], tags=m.get("tags", []),
-                             yes_bid=m.get("yes_bid", 0), yes_ask=m.get("yes_ask", 0), no_bid=m.get("no_bid", 0), no_ask=m.get("no_ask", 0),
-                             volume=m.get("volume", 0), volume_24h=m.get("volume_24h", 0), open_interest=m.get("open_interest", 0), last_price=m.get("last_price", 0))
-                  for m in markets_data.get("markets", [])]
-
-        if tags:
-            markets = [m for m in markets if any(tag.lower() in ' '.join(m.tags + [m.title, m.category]).lower() for tag in tags)]
-
-        series_groups = {}
-        for market in markets:
-            series = market.ticker.split('-')[0] if '-' in market.ticker else market.category
-            series_groups.setdefault(series, []).append(market)
-
-        correlated_pairs = []
-        for series_markets in series_groups.values():
-            if len(series_markets) < 2: continue
-            for i, m1 in enumerate(series_markets):
-                for m2 in series_markets[i+1:]:
-                    score = self._calculate_correlation_score(m1, m2)
-                    if score >= min_correlation_threshold: correlated_pairs.append((m1, m2, score))
-
-        return correlated_pairs
-
-    def _calculate_correlation_score(self, m1, m2):
-        score = 0
-        tag_overlap = len(set(m1.tags) & set(m2.tags))
-        total_tags = len(set(m1.tags) | set(m2.tags))
-        if total_tags: score += (tag_overlap / total_tags) * 0.3
-
-        title_words1, title_words2 = set(m1.title.lower().split()), set(m2.title.lower().split())
-        title_overlap = len(title_words1 & title_words2)
-        title_union = len(title_words1 | title_words2)
-        if title_union: score += (title_overlap / title_union) * 0.4
-
-        if m1.category == m2.category: score += 0.2
-        series1 = m1.ticker.split('-')[0] if '-' in m1.ticker else m1.category
-        series2 = m2.ticker.split('-')[0] if '-' in m2.ticker else m2.category
-        if series1 == series2: score += 0.1
-        return min(score, 1.0)
-
-    def detect_arbitrage_opportunities(self, correlated_pairs):
+    async def find_correlated_markets(self, tags=None, min_correlation_threshold=0.6, use_series_data=False, max_price_sum=None):
+        # Pages are parsed and tag-filtered while the next page is still in flight; the bounded queue caps buffered pages
+        pages = asyncio.Queue(maxsize=4)
+        async def pager():
+            try:
+                async for page in self.kalshi_client.iter_market_pages(): await pages.put(page)
+            finally: await pages.put(None)
+        producer = asyncio.create_task(pager())
+        frames = []
+        try:
+            while (page := await pages.get()) is not None:
+                frame = self._markets_frame(page.get("markets", []))
+                if tags and len(frame): frame = frame[self._tag_haystack(frame).str.contains(self._tag_pattern(tuple(tags)), regex=True)]
+                frames.append(frame)
+            await producer
+        finally: producer.cancel()
+        markets = pd.concat(frames, ignore_index=True) if frames else self._markets_frame([])
+
+        if use_series_data and len(markets):
+            # Only series that can form a pair are worth a lookup
+            counts = markets["series"].value_counts()
+            metadata = await self._series_metadata(counts.index[counts >= 2].tolist())
+            markets = markets.reset_index().merge(metadata, on="series", how="left").set_index("index")
+            markets["category"] = markets["category"].where(markets["category"] != "", markets["series_category"].fillna(""))
+
+        # Singleton series can never pair, so drop them before any per-group work; the rest are scored off the event loop
+        paired = markets[markets.groupby("series", sort=False)["series"].transform("size") >= 2]
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[loop.run_in_executor(score_pool() if len(group) >= PROCESS_POOL_MIN_GROUP else None,
+                                                              ArbitrageDetector._score_group, group[SCORING_COLUMNS], min_correlation_threshold, max_price_sum)
+                                         for _, group in paired.groupby("series", sort=False)])
+        results = [r for r in results if r is not None]
+
+        if not results: return pd.DataFrame(columns=[f"{c}_1" for c in PAIR_FIELDS] + [f"{c}_2" for c in PAIR_FIELDS] + ["correlation"])
+        first, second, correlation = (np.concatenate(parts) for parts in zip(*results))
+        return pd.concat([markets.loc[first, PAIR_FIELDS].add_suffix("_1").reset_index(drop=True),
+                          markets.loc[second, PAIR_FIELDS].add_suffix("_2").reset_index(drop=True),
+                          pd.Series(correlation, name="correlation")], axis=1)
+
+    def filter_pairs(self, pairs, tags=None, min_correlation_threshold=0.6):
+        # Narrows pairs scored for a wider tag set / lower threshold down to what a single request would have produced
+        keep = pairs["correlation"].to_numpy(dtype=float) >= min_correlation_threshold
+        if tags and len(pairs):
+            pattern = self._tag_pattern(tuple(tags))
+            for side in ("_1", "_2"):
+                # The category a standalone crawl tag-filtered on, i.e. before series metadata filled it in
+                side_markets = pairs[[f"tags{side}", f"title{side}", f"raw_category{side}"]].set_axis(["tags", "title", "category"], axis=1)
+                keep &= self._tag_haystack(side_markets).str.contains(pattern, regex=True).to_numpy()
+        return pairs[keep].reset_index(drop=True)
+
+    @staticmethod
+    def _score_group(group, threshold, max_price_sum=None):
+        # Pure function of its arguments so it can run in a worker process; each worker builds and caches its own scorer
+        return ArbitrageDetector._scorer(threshold, max_price_sum)(group)
+
+    @staticmethod
+    def _tag_haystack(markets):
+        return (markets["tags"].str.join(" ") + " " + markets["title"] + " " + markets["category"]).str.lower()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _tag_pattern(tags):
+        # One alternation scanned once per market instead of one substring search per tag; longest tags first
+        return re.compile("|".join(re.escape(tag) for tag in sorted({t.lower() for t in tags}, key=len, reverse=True)))
+
+    async def _series_metadata(self, series_tickers, concurrency=10):
+        semaphore = asyncio.Semaphore(concurrency)
+        async def fetch(ticker):
+            async with semaphore: return await self.kalshi_client.get_series(ticker)
+        results = await asyncio.gather(*[fetch(t) for t in series_tickers], return_exceptions=True)
+        rows = [{"series": t, "series_title": r.get("series", {}).get("title", ""), "series_category": r.get("series", {}).get("category", "")}
+                for t, r in zip(series_tickers, results) if isinstance(r, dict)]
+        return pd.DataFrame(rows, columns=["series", "series_title", "series_category"])
+
+    @staticmethod
+    def _markets_frame(raw_markets):
+        # Column-per-field layout: one contiguous array per attribute instead of one object per market
+        markets = pd.DataFrame(raw_markets)
+        for column in ("ticker", "title", "category"):
+            if column not in markets: markets[column] = ""
+        markets["tags"] = [t if isinstance(t, list) else [] for t in markets["tags"]] if "tags" in markets else [[] for _ in range(len(markets))]
+        for column in NUMERIC_MARKET_FIELDS:
+            markets[column] = pd.to_numeric(markets[column], errors="coerce").fillna(0) if column in markets else 0
+        # A market missing a count makes the whole page's column float; the MarketData int fields stay ints
+        markets[INTEGER_MARKET_FIELDS] = markets[INTEGER_MARKET_FIELDS].astype("int64")
+        markets["raw_category"] = markets["category"]
+        markets["series"] = markets["ticker"].str.split("-", n=1).str[0].where(markets["ticker"].str.contains("-", regex=False), markets["category"])
+        # Token sets are built once per market here rather than once per scoring pass
+        markets["tag_set"] = [frozenset(t) for t in markets["tags"]]
+        markets["title_tokens"] = [frozenset(t) for t in markets["title"].str.lower().str.split()]
+        return markets.reset_index(drop=True)
+
+    @staticmethod
+    def _bitsets(token_sets):
+        # Each market's token set becomes a packed uint64 bitset over the group's vocabulary, so overlap is popcount(a & b)
+        vocab = {}
+        columns = [[vocab.setdefault(token, len(vocab)) for token in tokens] for tokens in token_sets]
+        rows = np.repeat(np.arange(len(columns)), [len(c) for c in columns])
+        cols = np.fromiter((c for cs in columns for c in cs), dtype=np.uint64, count=len(rows))
+        bits = np.zeros((len(columns), max(1, -(-len(vocab) // 64))), dtype=np.uint64)
+        np.bitwise_or.at(bits, (rows, (cols >> np.uint64(6)).astype(np.intp)), np.left_shift(np.uint64(1), cols & np.uint64(63)))
+        return bits, popcount(bits).sum(axis=-1, dtype=np.int64)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _scorer(threshold, max_price_sum=None, tag_weight=0.3, title_weight=0.4, category_weight=0.2, series_weight=0.1):
+        # Built once per threshold/weights: token-set components are resolved heaviest first, and after each one
+        # any pair whose score so far plus the best case for what remains is below the threshold is dropped
+        set_columns = sorted([("title_tokens", title_weight), ("tag_set", tag_weight)], key=lambda c: -c[1])
+        cutoff = threshold - 1e-9
+
+        def pair_blocks(n):
+            # Upper-triangle pairs (i < j) in np.triu_indices order, cut into runs of whole rows of about SCORING_PAIR_BLOCK pairs
+            if n < 2: return
+            per_row = np.arange(n - 1, 0, -1)
+            ends = np.cumsum(per_row)
+            # A block ends after the row whose running pair count first reaches each multiple of the block size
+            cuts = np.unique(np.r_[0, np.searchsorted(ends, np.arange(SCORING_PAIR_BLOCK, ends[-1], SCORING_PAIR_BLOCK)) + 1, n - 1])
+            for start, stop in zip(cuts[:-1], cuts[1:]):
+                counts = per_row[start:stop]
+                i = np.repeat(np.arange(start, stop), counts)
+                yield i, i + 1 + np.arange(len(i)) - np.repeat(np.cumsum(counts) - counts, counts)
+
+        def score(group):
+            categories, series = group["category"].to_numpy(dtype=object), group["series"].to_numpy(dtype=object)
+            prices = group["last_price"].to_numpy(dtype=float) if max_price_sum is not None else None
+            bitsets = {column: ArbitrageDetector._bitsets(group[column].tolist()) for column, _ in set_columns}
+            hits = [hit for i, j in pair_blocks(len(group)) if (hit := score_block(i, j, categories, series, prices, bitsets)) is not None]
+            if not hits: return None
+            i, j, scores = (np.concatenate(parts) for parts in zip(*hits))
+            return group.index.to_numpy()[i], group.index.to_numpy()[j], scores
+
+        def score_block(i, j, categories, series, prices, bitsets):
+            if prices is not None:
+                # Fused arbitrage filter: pairs too expensive to trade are dropped before any token-set work
+                affordable = prices[i] + prices[j] < max_price_sum
+                i, j = i[affordable], j[affordable]
+            base = (categories[i] == categories[j]) * category_weight + (series[i] == series[j]) * series_weight
+            # Jaccard can never exceed min(|A|,|B|)/max(|A|,|B|), so sizes alone give a first upper bound
+            bounds = {}
+            for column, weight in set_columns:
+                sizes = bitsets[column][1]
+                largest = np.maximum(sizes[i], sizes[j])
+                bounds[column] = np.divide(np.minimum(sizes[i], sizes[j]), largest, out=np.zeros(len(i)), where=largest > 0) * weight
+            keep = np.flatnonzero(base + sum(bounds.values()) >= cutoff)
+            exact = {}
+            for column, weight in set_columns:
+                i, j, base = i[keep], j[keep], base[keep]
+                exact = {c: v[keep] for c, v in exact.items()}
+                bounds = {c: v[keep] for c, v in bounds.items() if c != column}
+                bits, sizes = bitsets[column]
+                overlap = popcount(bits[i] & bits[j]).sum(axis=-1, dtype=np.int64)
+                union = sizes[i] + sizes[j] - overlap
+                exact[column] = np.divide(overlap, union, out=np.zeros(len(i)), where=union > 0)
+                keep = np.flatnonzero(base + sum(exact[c] * w for c, w in set_columns if c in exact) + sum(bounds.values()) >= cutoff)
+            i, j = i[keep], j[keep]
+            exact = {c: v[keep] for c, v in exact.items()}
+            # Final score keeps the original summation order so threshold ties resolve exactly as before
+            scores = np.minimum(exact["tag_set"] * tag_weight + exact["title_tokens"] * title_weight
+                                + (categories[i] == categories[j]) * category_weight + (series[i] == series[j]) * series_weight, 1.0)
+            hit = scores >= threshold
+            if not hit.any(): return None
+            return i[hit], j[hit], scores[hit]
+        return score
+
+    @staticmethod
+    def _arbitrage_kernel(p1, p2, v1, v2, correlation):
+        # Pure array arithmetic over every pair; returns the qualifying rows plus their profit, risk tier and confidence
+        price_sum = p1 + p2
+        rows = np.flatnonzero(price_sum < ArbitrageDetector.MAX_PRICE_SUM)
+        avg_volume = (v1[rows] + v2[rows]) / 2
+        risk = np.select([avg_volume > 10000, avg_volume > 1000], ["Low", "Medium"], "High")
+        return rows, (1 - price_sum[rows]) * 100, risk, np.minimum(correlation[rows], 0.9)
+
+    def detect_arbitrage_opportunities(self, correlated_pairs, max_opportunities=None):
+        columns = ("last_price_1", "last_price_2", "volume_24h_1", "volume_24h_2", "correlation")
+        rows, profit, risk, confidence = self._arbitrage_kernel(*(correlated_pairs[c].to_numpy(dtype=float) for c in columns))
+        # Objects are only built for the rows that are returned, highest profit first
+        order = np.argsort(-profit, kind="stable")[:max_opportunities]
+        records = correlated_pairs.iloc[rows[order]].to_dict("records")
         opportunities = []
-        for m1, m2, correlation_score in correlated_pairs:
-            price1, price2 = m1.last_price, m2.last_price
-            if price1 + price2 < 0.95:
-                profit = (1 - (price1 + price2)) * 100
-                avg_volume = (m1.volume_24h + m2.volume_24h) / 2
-                risk = "Low" if avg_volume > 10000 else "Medium" if avg_volume > 1000 else "High"
-                opportunities.append(ArbitrageOpportunity(f"Arbitrage between '{m1.title}' and '{m2.title}'", [m1, m2], profit, risk, min(correlation_score, 0.9)))
-        return sorted(opportunities, key=lambda x: x.potential_profit, reverse=True)
+        for k, record in zip(order, records):
+            m1, m2 = (MarketData(**{f: record[f"{f}_{side}"] for f in MARKET_FIELDS}) for side in (1, 2))
+            opportunities.append(ArbitrageOpportunity(f"Arbitrage between '{m1.title}' and '{m2.title}'", [m1, m2], float(profit[k]), str(risk[k]), float(confidence[k])))
+        return opportunities
 
 class ArbitrageFinder:
+    # Concurrent find_opportunities calls arriving within one window share a single Kalshi crawl and scoring pass
+    BATCH_WINDOW = 0.25
+    BATCH_SIZE = 32
     def __init__(self, openai_key=None, kalshi_key=None):
-        self.kalshi_client = KalshiAPIClient(kalshi_key)
-        self.tag_generator = OpenAITagGenerator(openai_key)
+        # One keep-alive pool for every Kalshi and OpenAI call made during the finder's lifetime; HTTP/2 when h2 is installed
+        self._http = httpx.AsyncClient(http2=h2 is not None, limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60), timeout=httpx.Timeout(10.0, connect=2.0))
+        self.kalshi_client = KalshiAPIClient(kalshi_key, session=self._http)
+        self.tag_generator = OpenAITagGenerator(openai_key, http_client=self._http)
         self.detector = ArbitrageDetector(self.kalshi_client, self.tag_generator)
+        self._batch, self._flusher = None, None
+
+    async def __aenter__(self): return self
+    async def __aexit__(self, *exc_info): await self.aclose()
+    async def aclose(self):
+        if self._flusher is not None: self._flusher.cancel(); self._flusher = None
+        await self._http.aclose()
+
+    async def find_opportunities(self, context="", num_tags=10, max_opportunities=10, use_series_data=True, correlation_threshold=0.6):
+        tags = await self.tag_generator.generate_arbitrage_tags(context, num_tags) or ["election", "politics", "democrat", "republican", "2024", "president"]
+        if self._flusher is None: self._batch, self._flusher = asyncio.Queue(), asyncio.create_task(self._flush_batches())
+        future = asyncio.get_running_loop().create_future()
+        await self._batch.put((tuple(tags), use_series_data, correlation_threshold, future))
+        return self.detector.detect_arbitrage_opportunities(await future, max_opportunities)
+
+    async def _flush_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch.get()]
+            deadline = loop.time() + self.BATCH_WINDOW
+            while len(batch) < self.BATCH_SIZE and (remaining := deadline - loop.time()) > 0:
+                try: batch.append(await asyncio.wait_for(self._batch.get(), remaining))
+                except asyncio.TimeoutError: break
+            await self._run_batch(batch)
 
-    def find_opportunities(self, context="", num_tags=10, max_opportunities=10, use_series_data=True, correlation_threshold=0.6):
-        if use_series_data: self.kalshi_client.get_series()
-        tags = self.tag_generator.generate_arbitrage_tags(context, num_tags) or ["election", "politics", "democrat", "republican", "2024", "president"]
-        correlated_pairs = self.detector.find_correlated_markets(tags, correlation_threshold)
-        opportunities = self.detector.detect_arbitrage_opportunities(correlated_pairs)
-        return opportunities[:max_opportunities]
+    async def _run_batch(self, batch):
+        # One crawl over the union of tags at the loosest threshold, then each caller's pairs are filtered back out
+        for use_series_data in {request[1] for request in batch}:
+            requests = [request for request in batch if request[1] == use_series_data]
+            tags = None if any(not request[0] for request in requests) else sorted({t for request in requests for t in request[0]})
+            try:
+                pairs = await self.detector.find_correlated_markets(tags, min(request[2] for request in requests), use_series_data, ArbitrageDetector.MAX_PRICE_SUM)
+                for request_tags, _, threshold, future in requests:
+                    if not future.done(): future.set_result(self.detector.filter_pairs(pairs, request_tags, threshold))
+            except Exception as e:
+                for *_, future in requests:
+                    if not future.done(): future.set_exception(e)
 
     def print_opportunities(self, opportunities):
         if not opportunities: print("No arbitrage opportunities found."); return
-        print("ARBITRAGE OPPORTUNITIES FOUND")
-        print("="*50)
+        # The whole report is assembled first and written once
+        lines = ["ARBITRAGE OPPORTUNITIES FOUND", "="*50]
         for i, opp in enumerate(opportunities, 1):
-            print(f"{i}. {opp.description}")
-            print(f"   Profit: ${opp.potential_profit:.2f}")
-            print(f"   Risk: {opp.risk_level} | Confidence: {opp.confidence_score:.2f}")
+            lines += [f"{i}. {opp.description}", f"   Profit: ${opp.potential_profit:.2f}", f"   Risk: {opp.risk_level} | Confidence: {opp.confidence_score:.2f}"]
             for market in opp.markets:
-                print(f"   • {market.ticker}: {market.title}")
-                print(f"     Price: ${market.last_price:.2f} | Volume: {market.volume_24h}")
-                print(f"     Spread: Yes({market.yes_bid:.2f}-{market.yes_ask:.2f}) No({market.no_bid:.2f}-{market.no_ask:.2f})")
-        print("="*50)
+                lines += [f"   • {market.ticker}: {market.title}",
+                          f"     Price: ${market.last_price:.2f} | Volume: {market.volume_24h}",
+                          f"     Spread: Yes({market.yes_bid:.2f}-{market.yes_ask:.2f}) No({market.no_bid:.2f}-{market.no_ask:.2f})"]
+        lines.append("="*50)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
+    # The report uses a non-ASCII bullet; don't let a legacy console codec reject it
+    if hasattr(sys.stdout, "reconfigure"): sys.stdout.reconfigure(encoding="utf-8")
     print("Kalshi Arbitrage Opportunity Finder")
     print("="*50)
     openai_key = os.getenv("OPENAI_API_KEY")
     kalshi_key = os.getenv("KALSHI_API_KEY")
     if not openai_key: print("OPENAI_API_KEY required"); return 1
     if not kalshi_key: print("KALSHI_API_KEY recommended")
-    try:
-        finder = ArbitrageFinder(openai_key, kalshi_key)
-        opportunities = finder.find_opportunities("2024 election markets and political events", 15, 20, True, 0.6)
-        finder.print_opportunities(opportunities)
+    async def run():
+        async with ArbitrageFinder(openai_key, kalshi_key) as finder:
+            finder.print_opportunities(await finder.find_opportunities("2024 election markets and political events", 15, 20, True, 0.6))
+    try: asyncio.run(run())
     except Exception as e: print(f"Error: {e}"); return 1
+    finally: shutdown_score_pool()
     return 0
 
 if __name__ == "__main__": exit(main())
\ No newline at end of file
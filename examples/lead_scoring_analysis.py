@@ -155,11 +155,11 @@ def display_top_opportunities(scored_leads: pd.DataFrame):
     print("=" * 50)
 
     # Get top tier leads
-    top_tier = scored_leads[scored_leads['lead_tier'] == 'Top Tier'].head(10)
+    top_tier = scored_leads[scored_leads['lead_tier'] == 'Top Tier'].nlargest(10, 'composite_score')
 
     if len(top_tier) == 0:
         print("No Top Tier leads found. Checking High Priority...")
-        top_tier = scored_leads[scored_leads['lead_tier'] == 'High Priority'].head(10)
+        top_tier = scored_leads[scored_leads['lead_tier'] == 'High Priority'].nlargest(10, 'composite_score')
 
     if len(top_tier) == 0:
         print("No high-priority leads found. Check your data quality.")
@@ -7,84 +7,81 @@ Demonstrates the simplest way to get started with FMCSA lead scoring.
 import sys
 from pathlib import Path
 
-# Add the package to Python path (for direct execution)
-sys.path.insert(0, str(Path(__file__).parent.parent / 'python_data_functions'))
+# Resolved once at import; run from the repository root or with the package installed
+try:
+    from python_data_functions.lead_scoring import FMCALeadScorer
+    from python_data_functions.api import FMCSADataDownloader
+    from python_data_functions.leads import FMCALeadGenerator
+    IMPORT_ERROR = None
+except ImportError as e:
+    IMPORT_ERROR = e
+
+# Example data files (you would replace these with your actual files)
+EXAMPLE_CENSUS = Path("./data/raw/mcmis_census_example.csv")
+EXAMPLE_SMS = Path("./data/raw/sms_example.csv")
+
+# The whole guide is one constant string, written with a single call
+_BANNER = "\n".join([
+    "🚛 FMCSA Lead Generation - Quick Start",
+    "=" * 50,
+    "📋 This example shows how to:",
+    "   1. Download FMCSA datasets",
+    "   2. Score leads using comprehensive analysis",
+    "   3. Generate prioritized outreach lists",
+    "",
+    "💡 Key Commands (that generate spreadsheets):",
+    "",
+    "1. 🧪 Test that everything works:",
+    "   python test_imports.py",
+    "",
+    "2. 📥 Download FMCSA datasets:",
+    "   python -m python_data_functions --download-all",
+    "",
+    "3. 🚀 LEAD SCORING (Generates Excel/CSV files!):",
+    f"   python -m python_data_functions --score-leads --census-file {EXAMPLE_CENSUS}",
+    "   # Output: ./data/processed/top_leads_[date].csv",
+    "",
+    "4. 🎯 Full analysis with all data sources:",
+    f"   python -m python_data_functions --score-leads --census-file {EXAMPLE_CENSUS} --sms-file {EXAMPLE_SMS}",
+    "",
+    "5. 💻 CLI wrapper (easiest):",
+    f"   python fmcsa_cli.py --score-leads --census-file {EXAMPLE_CENSUS}",
+    "",
+    "📁 Output will be saved to:",
+    "   ./data/processed/top_leads_[timestamp].csv",
+    "   ./data/processed/lead_scoring_report_[timestamp].csv",
+    "",
+    "🎯 Lead Scoring Components:",
+    "   • Growth Potential (25%): Fleet size & utilization",
+    "   • Business Legitimacy (20%): Authority & bonding",
+    "   • Safety/Compliance (20%): BASIC scores & inspections",
+    "   • Contact Quality (15%): Email & phone completeness",
+    "   • Cargo Specialization (10%): High-value commodities",
+    "   • Company Recency (10%): New business identification",
+    "",
+    "🏆 Lead Tiers:",
+    "   • Top Tier (4.0-5.0): Immediate outreach priority",
+    "   • High Priority (3.5-4.0): Strong prospects",
+    "   • Medium Priority (2.0-3.5): Nurture candidates",
+    "   • Low Priority (0-2.0): Monitor for qualification",
+    "",
+    "🚀 Ready to get started? Run:",
+    "   python -m python_data_functions --download-all",
+    "",
+])
 
 def main():
     """Quick start example for FMCSA lead generation."""
-    print("🚛 FMCSA Lead Generation - Quick Start")
-    print("=" * 50)
-
-    # Example data files (you would replace these with your actual files)
-    example_census = Path("./data/raw/mcmis_census_example.csv")
-    example_sms = Path("./data/raw/sms_example.csv")
-
-    print("📋 This example shows how to:")
-    print("   1. Download FMCSA datasets")
-    print("   2. Score leads using comprehensive analysis")
-    print("   3. Generate prioritized outreach lists")
-    print()
-
-    print("💡 Key Commands (that generate spreadsheets):")
-    print()
-
-    print("1. 🧪 Test that everything works:")
-    print("   python test_imports.py")
-    print()
-
-    print("2. 📥 Download FMCSA datasets:")
-    print("   python -m python_data_functions --download-all")
-    print()
-
-    print("3. 🚀 LEAD SCORING (Generates Excel/CSV files!):")
-    print(f"   python -m python_data_functions --score-leads --census-file {example_census}")
-    print("   # Output: ./data/processed/top_leads_[date].csv")
-    print()
-
-    print("4. 🎯 Full analysis with all data sources:")
-    print(f"   python -m python_data_functions --score-leads --census-file {example_census} --sms-file {example_sms}")
-    print()
-
-    print("5. 💻 CLI wrapper (easiest):")
-    print(f"   python fmcsa_cli.py --score-leads --census-file {example_census}")
-    print()
-
-    print("📁 Output will be saved to:")
-    print("   ./data/processed/top_leads_[timestamp].csv")
-    print("   ./data/processed/lead_scoring_report_[timestamp].csv")
-    print()
-
-    print("🎯 Lead Scoring Components:")
-    print("   • Growth Potential (25%): Fleet size & utilization")
-    print("   • Business Legitimacy (20%): Authority & bonding")
-    print("   • Safety/Compliance (20%): BASIC scores & inspections")
-    print("   • Contact Quality (15%): Email & phone completeness")
-    print("   • Cargo Specialization (10%): High-value commodities")
-    print("   • Company Recency (10%): New business identification")
-    print()
-
-    print("🏆 Lead Tiers:")
-    print("   • Top Tier (4.0-5.0): Immediate outreach priority")
-    print("   • High Priority (3.5-4.0): Strong prospects")
-    print("   • Medium Priority (2.0-3.5): Nurture candidates")
-    print("   • Low Priority (0-2.0): Monitor for qualification")
-    print()
-
-    print("🚀 Ready to get started? Run:")
-    print("   python -m python_data_functions --download-all")
-    print()
+    sys.stdout.write(_BANNER)
+    sys.stdout.write("\n")
 
     # Test that imports work
-    try:
-        from python_data_functions.lead_scoring import FMCALeadScorer
-        from python_data_functions.api import FMCSADataDownloader
-        from python_data_functions.leads import FMCALeadGenerator
-        print("✅ Package imports successful!")
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
+    if IMPORT_ERROR is not None:
+        print(f"❌ Import error: {IMPORT_ERROR}")
         print("Make sure you're running this from the correct directory.")
         print("Try running: python test_imports.py")
         return False
+    print("✅ Package imports successful!")
 
     return True
 
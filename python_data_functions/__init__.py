@@ -15,24 +15,41 @@ Main Components:
 - consts.py: Configuration and constants
 """
 
-from .api import FMCSADataDownloader, FMCSAAPIClient, list_available_datasets
-from .parsers import (
-    parse_file_to_dataframe,
-    FMCSACSVParser,
-    FMCSAInspectionParser,
-    FMCSACensusParser,
-    FMCSASMSParser
-)
-from .leads import FMCALeadGenerator, generate_carrier_leads_by_region, generate_broker_leads_by_region
-from .lead_scoring import FMCALeadScorer, score_leads_template
-from .main import FMCSABulkProcessor
+import importlib
+
 from .consts import FMCSA_ENDPOINTS, API_CONFIG, DOWNLOAD_CONFIG
 
-# CLI modules
-from . import fmcsa_cli
-from . import run_leads
-from . import test_imports
-from . import setup
+# Submodules pull in requests, pandas and the scoring stack, so they are
+# imported on first attribute access rather than with the package (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "FMCSADataDownloader": "api",
+    "FMCSAAPIClient": "api",
+    "list_available_datasets": "api",
+    "parse_file_to_dataframe": "parsers",
+    "FMCSACSVParser": "parsers",
+    "FMCSAInspectionParser": "parsers",
+    "FMCSACensusParser": "parsers",
+    "FMCSASMSParser": "parsers",
+    "FMCALeadGenerator": "leads",
+    "generate_carrier_leads_by_region": "leads",
+    "generate_broker_leads_by_region": "leads",
+    "generate_leads_batch": "leads",
+    "FMCALeadScorer": "lead_scoring",
+    "score_leads_template": "lead_scoring",
+    "FMCSABulkProcessor": "main",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 __version__ = "1.0.0"
 __author__ = "FMCSA Data Tools"
@@ -55,6 +72,7 @@ __all__ = [
     "FMCALeadGenerator",
     "generate_carrier_leads_by_region",
     "generate_broker_leads_by_region",
+    "generate_leads_batch",
 
     # Lead Scoring
     "FMCALeadScorer",
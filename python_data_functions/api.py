@@ -3,28 +3,50 @@ FMCSA Data Portal API Functions
 Handles downloading bulk data from FMCSA datasets and APIs.
 """
 
+import asyncio
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import os
+import queue
+import shutil
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Mapping, Optional, Tuple, List
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib3.util.request import ACCEPT_ENCODING
 import zipfile
-import gzip
 from datetime import datetime, timedelta
 
+try:
+    import h2  # enables HTTP/2 multiplexing in FMCSAAPIClient
+except ImportError:
+    h2 = None
+
+try:
+    import pycurl  # optional libcurl transport for large bulk downloads
+except ImportError:
+    pycurl = None
+
 # Handle both relative and absolute imports
 try:
     from .consts import (
-        FMCSA_ENDPOINTS, API_CONFIG, DOWNLOAD_CONFIG,
-        RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG
+        FMCSA_ENDPOINTS, FMCSA_ENDPOINTS_VIEW, API_CONFIG, DOWNLOAD_CONFIG, FILE_FORMATS,
+        OUTPUT_CONFIG, CACHE_MAX_AGE, RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG, ensure_data_dirs
     )
 except ImportError:
     from consts import (
-        FMCSA_ENDPOINTS, API_CONFIG, DOWNLOAD_CONFIG,
-        RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG
+        FMCSA_ENDPOINTS, FMCSA_ENDPOINTS_VIEW, API_CONFIG, DOWNLOAD_CONFIG, FILE_FORMATS,
+        OUTPUT_CONFIG, CACHE_MAX_AGE, RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG, ensure_data_dirs
     )
 
+# Member suffixes worth extracting from ZIP archives (str.endswith takes a tuple)
+SUPPORTED_EXTENSIONS = tuple(ext.lower() for ext in FILE_FORMATS["zip"]["supported_extensions"])
+
 # Setup logging
 logging.basicConfig(
     level=getattr(logging, LOGGING_CONFIG["level"]),
@@ -37,22 +59,64 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _preallocate(f, size: int) -> None:
+    """Reserve size bytes for f in one extent allocation where the platform supports it."""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except OSError:
+            pass  # filesystem without fallocate support; the file just grows as written
+
+
 class FMCSADataDownloader:
     """Main class for downloading FMCSA bulk data."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_pycurl: bool = False):
         """
         Initialize the downloader.
 
         Args:
             api_key: FMCSA WebKey for API access (optional)
+            use_pycurl: Download through libcurl, with parallel Range requests
+                when the server supports them (requires pycurl)
         """
+        if use_pycurl and pycurl is None:
+            raise ImportError("pycurl is required for use_pycurl=True")
+
+        ensure_data_dirs()
         self.api_key = api_key
-        self.session = requests.Session()
-        self.session.headers.update(DOWNLOAD_CONFIG["headers"])
+        self.use_pycurl = use_pycurl
+        self._headers = dict(DOWNLOAD_CONFIG["headers"])
+        # Only advertise encodings urllib3 can decode while streaming (br needs brotli installed)
+        self._headers["Accept-Encoding"] = ACCEPT_ENCODING
+        self._local = threading.local()
 
         if api_key:
-            self.session.headers.update({"WebKey": api_key})
+            self._headers.update({"WebKey": api_key})
+
+    @property
+    def session(self) -> requests.Session:
+        """Session for the calling thread, so parallel downloads don't share one connection pool."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+            # urllib3 retries connect/read failures and throttling responses with
+            # exponential backoff, honouring Retry-After. max_retries counts attempts,
+            # so the first request plus max_retries - 1 retries; HEAD covers the size probe
+            adapter = HTTPAdapter(
+                max_retries=Retry(
+                    total=DOWNLOAD_CONFIG["max_retries"] - 1,
+                    backoff_factor=DOWNLOAD_CONFIG["retry_delay"],
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET", "HEAD"]
+                ),
+                pool_maxsize=len(FMCSA_ENDPOINTS)
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.session = session
+        return session
 
     def download_dataset(self, dataset_key: str, output_path: Optional[Path] = None) -> Path:
         """
@@ -72,9 +136,7 @@ class FMCSADataDownloader:
         url = dataset["url"]
 
         if not output_path:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{dataset_key.lower()}_{timestamp}.{dataset['format']}"
-            output_path = RAW_DIR / filename
+            output_path = self._output_path(dataset_key, datetime.now().strftime("%Y%m%d_%H%M%S"))
 
         logger.info(f"Downloading {dataset['name']} to {output_path}")
 
@@ -87,6 +149,60 @@ class FMCSADataDownloader:
             logger.error(f"Failed to download {dataset_key}: {e}")
             raise
 
+    def get_cached_or_download(self, dataset_key: str) -> Path:
+        """
+        Get a dataset, reusing the Parquet cache while it is still fresh.
+
+        CSV datasets are parsed once after download and cached as Parquet,
+        so later runs skip both the download and the CSV parse. Other formats
+        are downloaded as usual.
+
+        Args:
+            dataset_key: Key from FMCSA_ENDPOINTS
+
+        Returns:
+            Path to the cached Parquet file (or the raw download)
+        """
+        if dataset_key not in FMCSA_ENDPOINTS:
+            raise ValueError(f"Unknown dataset: {dataset_key}")
+
+        dataset = FMCSA_ENDPOINTS[dataset_key]
+        if dataset["format"] != "csv":
+            return self.download_dataset(dataset_key)
+
+        cache_path = RAW_DIR / f"{dataset_key.lower()}.{OUTPUT_CONFIG['cache_format']}"
+        max_age = CACHE_MAX_AGE.get(dataset["update_frequency"], CACHE_MAX_AGE["daily"])
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < max_age:
+            logger.info(f"Using cached {dataset_key}: {cache_path}")
+            return cache_path
+
+        csv_path = self.download_dataset(dataset_key)
+
+        try:
+            from .parsers import FMCSACSVParser
+        except ImportError:
+            from parsers import FMCSACSVParser
+
+        df = FMCSACSVParser(csv_path).parse_to_dataframe()
+        # Write beside the cache and swap in, so readers never see a partial file
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            df.to_parquet(tmp_path, compression=OUTPUT_CONFIG["cache_compression"])
+            tmp_path.replace(cache_path)
+        except (ImportError, OSError, ValueError, TypeError) as e:
+            # No pyarrow, a read-only or full RAW_DIR, or columns Arrow cannot convert
+            logger.warning(f"Parquet cache unavailable ({e}); using {csv_path}")
+            tmp_path.unlink(missing_ok=True)
+            return csv_path
+
+        logger.info(f"Cached {dataset_key} as {cache_path}")
+        return cache_path
+
+    @staticmethod
+    def _output_path(dataset_key: str, timestamp: str) -> Path:
+        """Raw-data path for a dataset download stamped with timestamp."""
+        return RAW_DIR / f"{dataset_key.lower()}_{timestamp}.{FMCSA_ENDPOINTS[dataset_key]['format']}"
+
     def download_all_datasets(self) -> Dict[str, Path]:
         """
         Download all available FMCSA datasets.
@@ -97,56 +213,152 @@ class FMCSADataDownloader:
         results = {}
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        for dataset_key, dataset in FMCSA_ENDPOINTS.items():
-            try:
-                filename = f"{dataset_key.lower()}_{timestamp}.{dataset['format']}"
-                output_path = RAW_DIR / filename
-                results[dataset_key] = self.download_dataset(dataset_key, output_path)
+        # Downloads are independent network streams, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(FMCSA_ENDPOINTS)) as executor:
+            futures = {
+                executor.submit(self.download_dataset, dataset_key, self._output_path(dataset_key, timestamp)): dataset_key
+                for dataset_key in FMCSA_ENDPOINTS
+            }
 
-            except Exception as e:
-                logger.error(f"Failed to download {dataset_key}: {e}")
-                continue
+            for future in as_completed(futures):
+                dataset_key = futures[future]
+                try:
+                    results[dataset_key] = future.result()
+
+                except Exception as e:
+                    logger.error(f"Failed to download {dataset_key}: {e}")
+                    continue
 
         return results
 
-    def _download_with_retry(self, url: str, output_path: Path) -> requests.Response:
-        """Download with retry logic for large files."""
-        last_exception = None
+    def _download_with_retry(self, url: str, output_path: Path) -> Optional[requests.Response]:
+        """Download a large file; retries and backoff are handled by the session's adapter."""
+        if self.use_pycurl:
+            return self._download_with_pycurl(url, output_path)
+
+        with self.session.get(
+            url,
+            stream=True,
+            timeout=DOWNLOAD_CONFIG["timeout"]
+        ) as response:
 
+            response.raise_for_status()
+
+            # Content-Length only gives the on-disk size when the body isn't encoded
+            encoded = response.headers.get("Content-Encoding", "identity") != "identity"
+            expected_size = 0 if encoded else int(response.headers.get("Content-Length") or 0)
+
+            # urllib3 undoes any Content-Encoding incrementally
+            response.raw.decode_content = True
+            self._stream_to_disk(response.raw, output_path, expected_size)
+
+            return response
+
+    def _download_with_pycurl(self, url: str, output_path: Path) -> None:
+        """
+        Download through libcurl, whose receive loop runs entirely in C.
+
+        When the server reports a size and accepts byte ranges, the file is
+        preallocated and fetched as parallel Range requests, each written in
+        place with os.pwrite; otherwise it is a single transfer.
+        """
+        with self.session.head(url, allow_redirects=True, headers={"Accept-Encoding": "identity"},
+                               timeout=DOWNLOAD_CONFIG["timeout"]) as probe:
+            size = int(probe.headers.get("Content-Length") or 0) if probe.ok else 0
+            accepts_ranges = probe.ok and probe.headers.get("Accept-Ranges", "").lower() == "bytes"
+
+        with output_path.open('wb') as f:
+            if accepts_ranges and size >= DOWNLOAD_CONFIG["pycurl_min_ranged_size"]:
+                _preallocate(f, size)
+                f.truncate(size)
+                step = -(-size // DOWNLOAD_CONFIG["pycurl_connections"])
+                ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+                # perform() releases the GIL, so one handle per thread transfers in parallel
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    for future in [executor.submit(self._curl_transfer, url, f.fileno(), r) for r in ranges]:
+                        future.result()
+            else:
+                self._curl_transfer(url, f.fileno())
+
+    def _curl_transfer(self, url: str, fd: int, byte_range: Optional[Tuple[int, int]] = None) -> None:
+        """Run one libcurl transfer into fd, at the start of byte_range if given."""
         for attempt in range(DOWNLOAD_CONFIG["max_retries"]):
+            offset = byte_range[0] if byte_range else 0
+
+            def write(chunk):
+                nonlocal offset
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    offset += written
+                    view = view[written:]
+
+            curl = pycurl.Curl()
             try:
-                logger.debug(f"Download attempt {attempt + 1} for {url}")
+                curl.setopt(pycurl.URL, url)
+                curl.setopt(pycurl.HTTPHEADER, [f"{k}: {v}" for k, v in self._headers.items() if k != "Accept-Encoding"])
+                curl.setopt(pycurl.FOLLOWLOCATION, True)
+                curl.setopt(pycurl.FAILONERROR, True)
+                # Abort stalled transfers rather than capping total time on multi-GB files
+                curl.setopt(pycurl.LOW_SPEED_LIMIT, 1)
+                curl.setopt(pycurl.LOW_SPEED_TIME, DOWNLOAD_CONFIG["timeout"])
+                curl.setopt(pycurl.WRITEFUNCTION, write)
+                if byte_range:
+                    curl.setopt(pycurl.RANGE, f"{byte_range[0]}-{byte_range[1]}")
+                else:
+                    curl.setopt(pycurl.ACCEPT_ENCODING, "")  # any encoding libcurl can decode
 
-                with self.session.get(
-                    url,
-                    stream=True,
-                    timeout=DOWNLOAD_CONFIG["timeout"]
-                ) as response:
+                curl.perform()
+                if byte_range and curl.getinfo(pycurl.RESPONSE_CODE) != 206:
+                    raise IOError(f"Server ignored Range request for {url}")
+                return
 
-                    response.raise_for_status()
+            except pycurl.error as e:
+                if attempt == DOWNLOAD_CONFIG["max_retries"] - 1:
+                    raise
+                wait_time = DOWNLOAD_CONFIG["retry_delay"] * (2 ** attempt)
+                logger.warning(f"Transfer attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
+                time.sleep(wait_time)
 
-                    # Handle different content encodings
-                    if response.headers.get('Content-Encoding') == 'gzip':
-                        content = gzip.decompress(response.content)
-                        output_path.write_bytes(content)
-                    else:
-                        with output_path.open('wb') as f:
-                            for chunk in response.iter_content(chunk_size=DOWNLOAD_CONFIG["chunk_size"]):
-                                if chunk:
-                                    f.write(chunk)
-
-                    return response
-
-            except Exception as e:
-                last_exception = e
-                if attempt < DOWNLOAD_CONFIG["max_retries"] - 1:
-                    wait_time = DOWNLOAD_CONFIG["retry_delay"] * (2 ** attempt)
-                    logger.warning(f"Download attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"All download attempts failed for {url}")
+            finally:
+                curl.close()
 
-        raise last_exception
+    def _stream_to_disk(self, source, output_path: Path, expected_size: int = 0) -> None:
+        """
+        Copy a byte stream to disk, overlapping network reads with disk writes.
+
+        A writer thread drains a bounded queue of buffers while this thread
+        keeps receiving, so a slow disk flush never stalls the socket. When
+        expected_size is known the file's extent is reserved up front.
+        """
+        buffers = queue.Queue(maxsize=DOWNLOAD_CONFIG["write_queue_depth"])
+        failures = []
+
+        def write():
+            try:
+                with output_path.open('wb') as f:
+                    _preallocate(f, expected_size)
+                    while (chunk := buffers.get()) is not None:
+                        f.write(chunk)
+                    # Drop any reserved space the stream didn't fill
+                    f.truncate()
+            except OSError as e:
+                failures.append(e)
+                # Keep draining so the reader never blocks on a full queue
+                while buffers.get() is not None:
+                    pass
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        try:
+            while not failures and (chunk := source.read(DOWNLOAD_CONFIG["chunk_size"])):
+                buffers.put(chunk)
+        finally:
+            buffers.put(None)
+            writer.join()
+
+        if failures:
+            raise failures[0]
 
     def extract_zip_file(self, zip_path: Path, extract_to: Optional[Path] = None) -> List[Path]:
         """
@@ -156,6 +368,9 @@ class FMCSADataDownloader:
             zip_path: Path to ZIP file
             extract_to: Directory to extract to (default: same as zip_path parent)
 
+        Members already extracted by an earlier call (same size and the archive's
+        timestamp) are not written again.
+
         Returns:
             List of extracted file paths
         """
@@ -163,16 +378,37 @@ class FMCSADataDownloader:
             extract_to = zip_path.parent
 
         extracted_files = []
+        root = extract_to.resolve()
 
         try:
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                for file_info in zip_ref.filelist:
+                for file_info in zip_ref.infolist():
                     # Only extract supported file types
-                    if any(file_info.filename.endswith(ext) for ext in ['.csv', '.txt', '.xlsx', '.xls']):
-                        extracted_path = extract_to / file_info.filename
-                        zip_ref.extract(file_info, extract_to)
-                        extracted_files.append(extracted_path)
-                        logger.info(f"Extracted: {extracted_path}")
+                    if file_info.is_dir() or not file_info.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                        continue
+
+                    # Never write outside the target directory (zip-slip)
+                    extracted_path = (root / file_info.filename).resolve()
+                    if not extracted_path.is_relative_to(root):
+                        logger.warning(f"Skipping unsafe archive member: {file_info.filename}")
+                        continue
+
+                    # Extracted files carry the member's archive timestamp, which a partial or
+                    # stale file never has, so a size and mtime match means it is already in place
+                    mtime = time.mktime(file_info.date_time + (0, 0, -1))
+                    if extracted_path.is_file():
+                        stat = extracted_path.stat()
+                        if stat.st_size == file_info.file_size and stat.st_mtime == mtime:
+                            extracted_files.append(extracted_path)
+                            logger.info(f"Already extracted: {extracted_path}")
+                            continue
+
+                    extracted_path.parent.mkdir(parents=True, exist_ok=True)
+                    with zip_ref.open(file_info) as src, extracted_path.open('wb') as dst:
+                        shutil.copyfileobj(src, dst, DOWNLOAD_CONFIG["chunk_size"])
+                    os.utime(extracted_path, (mtime, mtime))
+                    extracted_files.append(extracted_path)
+                    logger.info(f"Extracted: {extracted_path}")
 
         except Exception as e:
             logger.error(f"Failed to extract {zip_path}: {e}")
@@ -196,12 +432,19 @@ class FMCSAAPIClient:
 
         self.api_key = api_key
         self.base_url = API_CONFIG["base_url"]
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "WebKey": api_key,
             "Accept": "application/json",
             "Content-Type": "application/json"
-        })
+        }
+        # One pooled client for all API lookups; DOT queries share TLS connections
+        # (multiplexed over HTTP/2 when h2 is installed)
+        self.session = httpx.Client(
+            http2=h2 is not None,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=100),
+            timeout=API_CONFIG["timeout"]
+        )
 
     def get_carrier_data(self, dot_number: str) -> Dict:
         """
@@ -218,46 +461,65 @@ class FMCSAAPIClient:
         params = {"dot": dot_number}
 
         try:
-            response = self.session.get(
-                endpoint,
-                params=params,
-                timeout=API_CONFIG["timeout"]
-            )
+            response = self.session.get(endpoint, params=params)
             response.raise_for_status()
             return response.json()
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Failed to get carrier data for DOT {dot_number}: {e}")
             raise
 
-    def get_multiple_carriers(self, dot_numbers: List[str]) -> Dict[str, Dict]:
+    def get_multiple_carriers(self, dot_numbers: List[str], concurrency: int = 20) -> Dict[str, Dict]:
         """
         Get data for multiple carriers with rate limiting.
 
         Args:
             dot_numbers: List of DOT numbers
+            concurrency: Maximum number of requests in flight at once
 
         Returns:
             Dictionary mapping DOT numbers to carrier data
         """
-        results = {}
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aget_multiple_carriers(dot_numbers, concurrency))
 
-        for i, dot_number in enumerate(dot_numbers):
-            try:
-                results[dot_number] = self.get_carrier_data(dot_number)
+        # Called from a running event loop (Jupyter, async code), where asyncio.run is not
+        # allowed; run the requests on their own loop in a worker thread and wait, blocking
+        # the caller as the serial version did. Async callers should await aget_multiple_carriers.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.aget_multiple_carriers(dot_numbers, concurrency)).result()
 
-                # Rate limiting - avoid overwhelming the API
-                if i < len(dot_numbers) - 1:
-                    time.sleep(0.1)  # 100ms delay between requests
+    async def aget_multiple_carriers(self, dot_numbers: List[str], concurrency: int = 20) -> Dict[str, Dict]:
+        """
+        Async version of get_multiple_carriers.
 
-            except Exception as e:
-                logger.error(f"Failed to get data for DOT {dot_number}: {e}")
-                results[dot_number] = {"error": str(e)}
+        Requests run concurrently; the rate limit is the number in flight
+        rather than a fixed delay between requests.
+        """
+        endpoint = urljoin(self.base_url, API_CONFIG["carrier_data_endpoint"])
+        semaphore = asyncio.Semaphore(concurrency)
 
-        return results
+        async def fetch(client: httpx.AsyncClient, dot_number: str) -> Dict:
+            async with semaphore:
+                try:
+                    response = await client.get(endpoint, params={"dot": dot_number})
+                    response.raise_for_status()
+                    return response.json()
+
+                except Exception as e:
+                    logger.error(f"Failed to get data for DOT {dot_number}: {e}")
+                    return {"error": str(e)}
+
+        limits = httpx.Limits(max_connections=concurrency)
+        async with httpx.AsyncClient(http2=h2 is not None, headers=self.headers, limits=limits, timeout=API_CONFIG["timeout"]) as client:
+            carriers = await asyncio.gather(*[fetch(client, dot_number) for dot_number in dot_numbers])
+
+        return dict(zip(dot_numbers, carriers))
 
 
-def get_dataset_info(dataset_key: str) -> Dict:
+def get_dataset_info(dataset_key: str) -> Mapping:
     """
     Get information about a specific dataset.
 
@@ -265,19 +527,19 @@ def get_dataset_info(dataset_key: str) -> Dict:
         dataset_key: Dataset key from FMCSA_ENDPOINTS
 
     Returns:
-        Dataset information dictionary
+        Read-only view of the dataset information
     """
     if dataset_key not in FMCSA_ENDPOINTS:
         raise ValueError(f"Unknown dataset: {dataset_key}")
 
-    return FMCSA_ENDPOINTS[dataset_key].copy()
+    return FMCSA_ENDPOINTS_VIEW[dataset_key]
 
 
-def list_available_datasets() -> Dict[str, Dict]:
+def list_available_datasets() -> Mapping[str, Mapping]:
     """
     List all available FMCSA datasets.
 
     Returns:
-        Dictionary of all available datasets
+        Read-only view of all available datasets
     """
-    return FMCSA_ENDPOINTS.copy() 
\ No newline at end of file
+    return FMCSA_ENDPOINTS_VIEW 
\ No newline at end of file
@@ -4,7 +4,9 @@ Contains URLs, API endpoints, and configuration for downloading bulk carrier/bro
 """
 
 import os
+import re
 from pathlib import Path
+from types import MappingProxyType
 
 # Base directories
 BASE_DIR = Path(__file__).parent.parent
@@ -12,9 +14,12 @@ DATA_DIR = BASE_DIR / "data"
 RAW_DIR = DATA_DIR / "raw"
 PROCESSED_DIR = DATA_DIR / "processed"
 
-# Ensure directories exist
-for dir_path in [DATA_DIR, RAW_DIR, PROCESSED_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+
+def ensure_data_dirs():
+    """Create the data directories; called by writers rather than on import."""
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
 
 # FMCSA Dataset URLs and Endpoints
 FMCSA_ENDPOINTS = {
@@ -62,6 +67,10 @@ FMCSA_ENDPOINTS = {
     }
 }
 
+# Read-only view handed to callers instead of a fresh copy per call; each dataset's
+# entry is wrapped too, so callers can't rewrite a URL in FMCSA_ENDPOINTS through it
+FMCSA_ENDPOINTS_VIEW = MappingProxyType({key: MappingProxyType(info) for key, info in FMCSA_ENDPOINTS.items()})
+
 # FMCSA Developer API Configuration
 API_CONFIG = {
     "base_url": "https://mobile.fmcsa.dot.gov",
@@ -110,6 +119,39 @@ VALIDATION_RULES = {
     }
 }
 
+# Compile each pattern once so validators don't re-parse it per call
+for _rule in VALIDATION_RULES.values():
+    if "pattern" in _rule:
+        _rule["compiled"] = re.compile(_rule["pattern"])
+
+
+def validate_dot_series(series):
+    """Column-wise VALIDATION_RULES["dot_number"] check; returns a boolean mask."""
+    values = series.astype(str).str.strip()
+    return values.str.isdecimal() & (values.str.len() <= 8)
+
+
+def validate_state_series(series):
+    """Column-wise VALIDATION_RULES["state"] check; returns a boolean mask."""
+    return series.astype(str).str.match(VALIDATION_RULES["state"]["compiled"])
+
+
+# Census column dtypes (cleaned column names); low-cardinality columns are stored
+# as categories, everything else is read as str. City and equipment fields repeat
+# heavily across carriers, so lead filters on them work on the category codes.
+CENSUS_DTYPES = {
+    "phy_state": "category",
+    "mail_state": "category",
+    "phy_country": "category",
+    "phy_city": "category",
+    "carrier_operation": "category",
+    "entity_type": "category",
+    "cargo_type": "category",
+    "equipment_type": "category",
+    "commodity_type": "category",
+    "vehicle_type": "category"
+}
+
 # Food Safety (FSMA) specific constants
 FSMA_CONFIG = {
     "violation_codes": [
@@ -127,7 +169,10 @@ FSMA_CONFIG = {
 
 # Download configuration
 DOWNLOAD_CONFIG = {
-    "chunk_size": 8192,  # 8KB chunks for streaming downloads
+    "chunk_size": 1 << 20,  # 1MB buffers for streaming downloads
+    "write_queue_depth": 16,  # buffers in flight between the network reader and disk writer
+    "pycurl_connections": 4,  # parallel Range requests per file with use_pycurl
+    "pycurl_min_ranged_size": 64 << 20,  # smaller files are fetched in one transfer
     "timeout": 300,  # 5 minutes timeout for large files
     "max_retries": 3,
     "retry_delay": 5,  # seconds
@@ -145,7 +190,18 @@ OUTPUT_CONFIG = {
     "default_format": "csv",
     "compression": "gzip",  # for large files
     "date_format": "%Y-%m-%d",
-    "datetime_format": "%Y-%m-%d %H:%M:%S"
+    "datetime_format": "%Y-%m-%d %H:%M:%S",
+    "cache_format": "parquet",  # parsed copy of CSV datasets reused between runs
+    "cache_compression": "zstd",
+    "processed_format": "parquet",  # processed/merged datasets; "csv" with --csv-out
+    "processed_csv_compression": {"method": "zstd", "level": 3}  # CSV outputs, written as .csv.zst
+}
+
+# How long a cached dataset stays fresh, keyed by FMCSA_ENDPOINTS update_frequency (seconds)
+CACHE_MAX_AGE = {
+    "daily": 24 * 3600,
+    "daily_monthly": 24 * 3600,
+    "monthly": 30 * 24 * 3600
 }
 
 # Logging configuration
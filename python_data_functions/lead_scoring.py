@@ -6,12 +6,205 @@ Scores carriers and brokers to identify active operators and high-growth prospec
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
+import functools
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+try:
+    import pyarrow as pa  # enables pandas' multithreaded pyarrow CSV engine
+except ImportError:
+    pa = None
+
+# Handle both relative and absolute imports
+try:
+    from .utils import write_csv
+except ImportError:
+    from utils import write_csv
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the scoring components, compiled once at import
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_REVOKED_RE = re.compile(r'revoked|suspended')
+_BOND_VALID_RE = re.compile(r'active|valid')
+
+# Specialization bonus per matched cargo category (each category counts once per carrier)
+_CARGO_BONUS = {
+    'hazardous_materials': 2,
+    'specialized': 1.5,
+    'valuable': 1,
+    'time_sensitive': 1,
+    'intermodal': 0.5,
+    'international': 0.5
+}
+
+# 1 for the ASCII digits, 0 for every other byte
+_IS_DIGIT = np.zeros(256, dtype=np.int8)
+_IS_DIGIT[ord('0'):ord('9') + 1] = 1
+
+# Inner bin edges for the right-closed buckets the components score against. Bucket i
+# covers (edges[i-1], edges[i]], which is what np.searchsorted(..., side='left') returns.
+_FLEET_EDGES = np.array([1, 5, 10, 20, 50])
+_UTILIZATION_EDGES = np.array([1.5, 2])
+_INSPECTION_EDGES = np.array([20, 50])
+_INSPECTION_POINTS = np.array([0, 0.5, 1], dtype=np.float32)
+_PHONE_EDGES = np.array([7, 10])
+_RECENCY_EDGES = np.array([30, 90, 365, 730])
+_RECENCY_POINTS = np.array([5, 4, 3, 2, 1], dtype=np.float32)
+
+# Composite score tiers: (0, 2], (2, 3.5], (3.5, 5], (5, inf)
+_TIER_EDGES = np.array([2, 3.5, 5])
+_TIER_LABELS = ['Low Priority', 'Medium Priority', 'High Priority', 'Top Tier']
+
+# Output column for each scoring component
+_SCORE_COLUMNS = {
+    'growth_potential': 'growth_score',
+    'legitimacy': 'legitimacy_score',
+    'safety_compliance': 'safety_score',
+    'contact_quality': 'contact_score',
+    'specialization_value': 'specialization_score',
+    'company_recency': 'recency_score'
+}
+
+# Rows per block when combining components; keeps each block's working set in L2
+_COMBINE_BLOCK = 1 << 15
+
+# Frames with at least this many rows compute their six components on a thread pool
+_PARALLEL_THRESHOLD = 100_000
+_COMPONENT_WORKERS = 6
+
+# Distinct cargo descriptions whose bonus is remembered between scoring calls
+_CARGO_CACHE_SIZE = 1 << 16
+
+# Low-cardinality status text, matched per category rather than per row
+_CATEGORY_COLS = ('entity_type', 'carrier_operation', 'safety_rating', 'authority_status', 'bond_status')
+
+# Text matched case-insensitively; lowercased and blank-filled once per scoring call.
+# email is left as-is because the '.com' bonus has always been case-sensitive.
+_TEXT_COLS = _CATEGORY_COLS + ('cargo_carried',)
+
+
+@functools.lru_cache(maxsize=1)
+def _component_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every scorer, created the first time a large frame is scored."""
+    return ThreadPoolExecutor(max_workers=_COMPONENT_WORKERS, thread_name_prefix='lead-scoring')
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_schema(columns: frozenset) -> Dict[str, Any]:
+    """Presence flags for the optional scoring inputs, resolved once per distinct schema."""
+    return {
+        'has_utilization': 'power_units' in columns,
+        'has_authority': 'authority_status' in columns,
+        'has_safety_rating': 'safety_rating' in columns,
+        'has_email': 'email' in columns,
+        'has_phone': 'phone' in columns,
+        'has_cargo': 'cargo_carried' in columns,
+        'has_add_date': 'add_date' in columns,
+        'address_fields': tuple(field for field in ('phy_city', 'phy_state', 'phy_zip') if field in columns)
+    }
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_basic_columns(columns: frozenset) -> Tuple[str, ...]:
+    """BASIC score columns present in a frame, resolved once per distinct schema."""
+    return tuple(col for col in FMCALeadScorer._BASIC_COLS if col in columns)
+
+
+def _numeric(df: pd.DataFrame, column: str, fill: float) -> np.ndarray:
+    """
+    A column as float64 with missing or unparseable values replaced by ``fill``.
+
+    Columns that already have a numeric dtype (numpy or Arrow-backed) are cast in one
+    step; only text columns go through pd.to_numeric's per-value parse.
+    """
+    if column not in df.columns:
+        return np.full(len(df), fill, dtype=np.float64)
+
+    values = df[column]
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors='coerce')
+    # Arrow columns can hold both nulls (na_value) and NaN from failed parses
+    result = values.to_numpy(dtype=np.float64, na_value=fill)
+    return np.where(np.isnan(result), fill, result)
+
+
+def _contains(values: Union[pd.Series, pd.Index], pattern: Union[str, re.Pattern]) -> np.ndarray:
+    """str.contains that also takes compiled patterns on Arrow-backed strings (as their source)."""
+    dtype = values.dtype
+    if isinstance(pattern, re.Pattern) and (isinstance(dtype, pd.ArrowDtype) or
+                                            getattr(dtype, 'storage', None) == 'pyarrow'):
+        matches = values.str.contains(pattern.pattern, na=False)
+    else:
+        matches = values.str.contains(pattern, na=False)
+    return np.asarray(matches, dtype=bool)
+
+
+def _basic_mean(df: pd.DataFrame, basic_columns: Tuple[str, ...]) -> np.ndarray:
+    """Row mean of the available BASIC scores ignoring blanks; 0 where a carrier has none."""
+    # One row per BASIC so each column is written contiguously, then reduced across rows
+    matrix = np.empty((len(basic_columns), len(df)), dtype=np.float64)
+    for row, column in enumerate(basic_columns):
+        matrix[row] = _numeric(df, column, np.nan)
+
+    present = ~np.isnan(matrix)
+    counts = present.sum(axis=0)
+    totals = np.where(present, matrix, 0).sum(axis=0)
+    return np.divide(totals, counts, out=np.zeros(len(df), dtype=np.float64), where=counts > 0)
+
+
+def _digit_counts(values: pd.Series) -> np.ndarray:
+    """Number of digits in each value, counted over one byte buffer rather than a regex per row."""
+    texts = values.fillna('').astype(str)
+    if texts.empty:
+        return np.zeros(0, dtype=np.int64)
+
+    # 'replace' encodes each non-ASCII character as a single '?', so byte offsets equal character offsets
+    buffer = np.frombuffer(''.join(texts).encode('ascii', errors='replace'), dtype=np.uint8)
+    digit_totals = np.concatenate(([0], np.cumsum(_IS_DIGIT[buffer], dtype=np.int64)))
+
+    lengths = texts.str.len().to_numpy(dtype=np.int64)
+    ends = np.cumsum(lengths)
+    return digit_totals[ends] - digit_totals[ends - lengths]
+
+
+def _is_filled(values: pd.Series) -> np.ndarray:
+    """True where a field has a value; text must also be non-blank once stripped."""
+    filled = values.notna().to_numpy(dtype=bool)
+    if not pd.api.types.is_numeric_dtype(values):
+        # Non-string cells come back NaN from .str and so count as filled, like their str() would
+        filled = filled & (values.str.strip() != '').to_numpy(dtype=bool, na_value=False)
+    return filled
+
+
+def _lower_text(values: pd.Series) -> pd.Series:
+    """Lowercase a text column with missing values as ''; categoricals only lowercase their categories."""
+    if pd.api.types.is_numeric_dtype(values):
+        values = values.astype(object)  # e.g. an all-empty column parsed as float
+    return values.str.lower().fillna('')
+
+
+def _category_contains(df: pd.DataFrame, column: str, pattern) -> np.ndarray:
+    """str.contains evaluated once per category of a lowercased column and broadcast through the codes."""
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+
+    values = df[column]
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype('category')
+
+    categories = values.cat.categories
+    if len(categories) == 0:
+        return np.zeros(len(df), dtype=bool)
+
+    # Trailing False is picked up by code -1 (missing values)
+    matches = np.append(_contains(categories, pattern), False)
+    return matches[values.cat.codes.to_numpy()]
+
 
 class FMCALeadScorer:
     """
@@ -19,6 +212,16 @@ class FMCALeadScorer:
     Prioritizes leads based on growth potential, legitimacy, and outreach readiness.
     """
 
+    # Columns the scorer reads from each source; everything else is never touched
+    _CENSUS_COLS = ('dot_number', 'fleet_size', 'entity_type', 'carrier_operation', 'email', 'phone',
+                    'phy_city', 'phy_state', 'phy_zip', 'cargo_carried', 'add_date')
+    _SMS_COLS = ('dot_number', 'power_units', 'drivers', 'vmt', 'safety_rating', 'total_inspections',
+                 'unsafe_driving_score', 'hours_of_service_compliance_score', 'vehicle_maintenance_score',
+                 'controlled_substances/alcohol_score', 'hazardous_materials_compliance_score',
+                 'driver_fitness_score')
+    _LI_COLS = ('dot_number', 'authority_status', 'bond_status', 'bond_amount')
+    _BASIC_COLS = _SMS_COLS[6:]
+
     def __init__(self):
         # Define scoring weights for different factors
         self.scoring_weights = {
@@ -52,203 +255,262 @@ class FMCALeadScorer:
                                    census_df: pd.DataFrame,
                                    sms_df: Optional[pd.DataFrame] = None,
                                    li_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
-        """Calculate comprehensive lead scores using all available FMCSA data sources."""
-        logger.info("Calculating comprehensive lead scores...")
-
-        scored_df = census_df.copy()
+        """
+        Calculate comprehensive lead scores using all available FMCSA data sources.
 
-        # Calculate all scoring components in one pass
-        component_scores = self._calculate_all_components(scored_df, sms_df, li_df)
+        Rows keep the census order; use get_top_leads for the ranked outreach list.
+        """
+        logger.info("Calculating comprehensive lead scores...")
 
-        # Calculate composite score using vectorized operations
-        scored_df['composite_score'] = sum(
-            component_scores[component] * weight
-            for component, weight in self.scoring_weights.items()
-        )
+        # Join SMS and L&I once; every component reads from the same frame
+        joined = self._join_sources(census_df, sms_df, li_df)
+        component_scores = self._calculate_all_components(joined)
 
-        # Add scoring tier and sort
-        scored_df['lead_tier'] = pd.cut(
-            scored_df['composite_score'],
-            bins=[0, 2, 3.5, 5, float('inf')],
-            labels=['Low Priority', 'Medium Priority', 'High Priority', 'Top Tier']
-        )
+        # Composite score and tier in one blocked pass over the component arrays
+        composite, tier_codes = self._combine_and_tier(component_scores)
 
-        scored_df = scored_df.sort_values('composite_score', ascending=False)
+        # Attach the score columns to the census as-is; rows stay in census order and only
+        # get_top_leads ranks them, so there is no full sort of every lead
+        score_columns = {
+            'composite_score': composite,
+            'lead_tier': pd.Categorical.from_codes(tier_codes, categories=_TIER_LABELS, ordered=True),
+            **{_SCORE_COLUMNS[component]: scores.to_numpy() for component, scores in component_scores.items()}
+        }
+        scored_df = census_df.assign(**score_columns)
 
         logger.info(f"Scored {len(scored_df)} leads. Top tier: {len(scored_df[scored_df['lead_tier'] == 'Top Tier'])}")
 
         return scored_df
 
-    def _calculate_all_components(self, df: pd.DataFrame, sms_df: Optional[pd.DataFrame],
-                                li_df: Optional[pd.DataFrame]) -> Dict[str, pd.Series]:
-        """Calculate all scoring components efficiently in one pass."""
-        return {
-            'growth_potential': self._calculate_growth_score(df, sms_df),
-            'legitimacy': self._calculate_legitimacy_score(df, li_df),
-            'safety_compliance': self._calculate_safety_score(df, sms_df),
-            'contact_quality': self._calculate_contact_score(df),
-            'specialization_value': self._calculate_specialization_score(df),
-            'company_recency': self._calculate_recency_score(df)
+    def _combine_and_tier(self, component_scores: Dict[str, pd.Series]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Weight, sum and tier the components block by block.
+
+        Each block's multiply-adds and tier lookup run while its slice of the component
+        arrays is still in cache, and results go straight into the float32 score and
+        int8 tier-code outputs. Accumulation is float64 in scoring_weights order, and
+        tiers are taken before the downcast, so boundary composites keep their tier.
+        """
+        columns = [(component_scores[component].to_numpy(), weight)
+                   for component, weight in self.scoring_weights.items()]
+        n_rows = len(columns[0][0]) if columns else 0
+
+        scores = np.empty(n_rows, dtype=np.float32)
+        tier_codes = np.empty(n_rows, dtype=np.int8)
+        composite = np.empty(min(n_rows, _COMBINE_BLOCK), dtype=np.float64)
+        scratch = np.empty_like(composite)
+
+        for start in range(0, n_rows, _COMBINE_BLOCK):
+            stop = min(start + _COMBINE_BLOCK, n_rows)
+            acc, tmp = composite[:stop - start], scratch[:stop - start]
+
+            acc.fill(0)
+            for values, weight in columns:
+                np.multiply(values[start:stop], weight, out=tmp, dtype=np.float64)
+                acc += tmp
+
+            codes = tier_codes[start:stop]
+            codes[:] = np.searchsorted(_TIER_EDGES, acc, side='left')
+            codes[~(acc > 0)] = -1  # pd.cut left the (.., 0] range untiered
+            scores[start:stop] = acc
+
+        return scores, tier_codes
+
+    def _join_sources(self, census_df: pd.DataFrame, sms_df: Optional[pd.DataFrame],
+                      li_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """Left-join the needed SMS and L&I columns onto the census, keeping the census index."""
+        joined = census_df[[col for col in self._CENSUS_COLS if col in census_df.columns]]
+
+        for extra_df, columns in ((sms_df, self._SMS_COLS), (li_df, self._LI_COLS)):
+            if extra_df is None or 'dot_number' not in extra_df.columns:
+                continue
+            # One row per DOT number so the join never fans out census rows
+            lookup = (extra_df[[col for col in columns if col in extra_df.columns]]
+                      .drop_duplicates('dot_number')
+                      .set_index('dot_number'))
+            joined = joined.join(lookup, on='dot_number', how='left')
+
+        joined = joined.assign(**{col: _lower_text(joined[col]) for col in _TEXT_COLS if col in joined.columns})
+        return joined.astype({col: 'category' for col in _CATEGORY_COLS if col in joined.columns})
+
+    def _calculate_all_components(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """Calculate all scoring components, concurrently for large frames."""
+        # Which optional inputs this frame carries, decided once and passed to every component;
+        # never stored on the scorer, so concurrent calls with different schemas can't mix them up
+        flags = _resolve_schema(frozenset(df.columns))
+
+        calculators = {
+            'growth_potential': self._calculate_growth_score,
+            'legitimacy': self._calculate_legitimacy_score,
+            'safety_compliance': self._calculate_safety_score,
+            'contact_quality': self._calculate_contact_score,
+            'specialization_value': self._calculate_specialization_score,
+            'company_recency': self._calculate_recency_score
         }
 
-    def _calculate_growth_score(self, census_df: pd.DataFrame, sms_df: Optional[pd.DataFrame]) -> pd.Series:
+        if len(df) < _PARALLEL_THRESHOLD:
+            return {component: calculate(df, flags) for component, calculate in calculators.items()}
+
+        # Components read disjoint columns of the same frame; numpy/pandas kernels release the GIL
+        executor = _component_executor()
+        futures = {component: executor.submit(calculate, df, flags) for component, calculate in calculators.items()}
+        return {component: future.result() for component, future in futures.items()}
+
+    def _calculate_growth_score(self, df: pd.DataFrame, flags: Dict[str, Any]) -> pd.Series:
         """Calculate growth potential score based on fleet size and utilization."""
         # Fleet size scoring (vectorized)
-        fleet_size = pd.to_numeric(census_df.get('fleet_size', 0), errors='coerce').fillna(0)
-        fleet_scores = pd.cut(fleet_size, bins=[0, 1, 5, 10, 20, 50, float('inf')],
-                            labels=[0, 1, 2, 3, 4, 5], include_lowest=True).astype(int)
+        fleet_size = _numeric(df, 'fleet_size', 0)
+        fleet_scores = np.searchsorted(_FLEET_EDGES, fleet_size, side='left').astype(np.int8)
 
-        if sms_df is None or 'dot_number' not in sms_df.columns:
-            return fleet_scores
-
-        # Merge SMS data for utilization scoring
-        merged = census_df[['dot_number']].merge(
-            sms_df[['dot_number', 'power_units', 'drivers', 'vmt']],
-            on='dot_number', how='left'
-        )
+        if not flags['has_utilization']:
+            return pd.Series(fleet_scores, index=df.index)
 
         # Utilization ratio scoring
-        power_units = pd.to_numeric(merged['power_units'], errors='coerce').fillna(0)
-        drivers = pd.to_numeric(merged['drivers'], errors='coerce').fillna(1)  # Avoid division by zero
-        utilization_ratio = power_units / drivers
+        power_units = _numeric(df, 'power_units', 0)
+        drivers = _numeric(df, 'drivers', 1)  # Avoid division by zero
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization_ratio = np.nan_to_num(power_units / drivers, nan=0, posinf=np.inf)  # 0/0 means no fleet
 
-        utilization_scores = pd.cut(utilization_ratio, bins=[0, 1.5, 2, float('inf')],
-                                  labels=[0, 1, 2], include_lowest=True).astype(int)
+        utilization_scores = np.searchsorted(_UTILIZATION_EDGES, utilization_ratio, side='left').astype(np.int8)
 
         # VMT scoring (high mileage = high utilization)
-        vmt = pd.to_numeric(merged['vmt'], errors='coerce').fillna(0)
-        avg_vmt = vmt / power_units.replace(0, 1)  # Avoid division by zero
-        vmt_scores = (avg_vmt >= 50000).astype(int)
+        vmt = _numeric(df, 'vmt', 0)
+        avg_vmt = vmt / np.where(power_units == 0, 1, power_units)  # Avoid division by zero
+        vmt_scores = (avg_vmt >= 50000).astype(np.int8)
 
-        return (fleet_scores + utilization_scores + vmt_scores).clip(upper=5)
+        return pd.Series(fleet_scores + utilization_scores + vmt_scores, index=df.index).clip(upper=5)
 
-    def _calculate_legitimacy_score(self, census_df: pd.DataFrame, li_df: Optional[pd.DataFrame]) -> pd.Series:
+    def _calculate_legitimacy_score(self, df: pd.DataFrame, flags: Dict[str, Any]) -> pd.Series:
         """Calculate legitimacy score based on authority status and bonding."""
         # Base score from entity type
-        entity_type = census_df.get('entity_type', '').str.lower().fillna('')
-        operation = census_df.get('carrier_operation', '').str.lower().fillna('')
+        is_carrier = (_category_contains(df, 'entity_type', 'carrier') |
+                      _category_contains(df, 'carrier_operation', 'carrier'))
+        is_broker = (_category_contains(df, 'entity_type', 'broker') |
+                     _category_contains(df, 'carrier_operation', 'broker'))
 
-        base_scores = pd.Series([3] * len(census_df), index=census_df.index)
-        base_scores += (entity_type.str.contains('carrier') | operation.str.contains('carrier')).astype(int)
-        base_scores += (entity_type.str.contains('broker') | operation.str.contains('broker')).astype(int)
+        base_scores = pd.Series(np.full(len(df), 3, dtype=np.int8), index=df.index)
+        base_scores += is_carrier.astype(np.int8)
+        base_scores += is_broker.astype(np.int8)
 
-        if li_df is None or 'dot_number' not in li_df.columns:
+        if not flags['has_authority']:
             return base_scores.clip(0, 5)
 
-        # Merge L&I data
-        merged = census_df[['dot_number']].merge(
-            li_df[['dot_number', 'authority_status', 'bond_status', 'bond_amount']],
-            on='dot_number', how='left'
-        )
-
         # Authority status scoring
-        authority_scores = pd.Series([0] * len(merged), index=merged.index)
-        authority_status = merged.get('authority_status', '').str.lower().fillna('')
-        authority_scores += authority_status.str.contains('active').astype(int)
-        authority_scores -= (authority_status.str.contains('revoked|suspended')).astype(int) * 2
+        authority_scores = pd.Series(np.zeros(len(df), dtype=np.int8), index=df.index)
+        authority_scores += _category_contains(df, 'authority_status', 'active').astype(np.int8)
+        authority_scores -= _category_contains(df, 'authority_status', _REVOKED_RE).astype(np.int8) * 2
 
         # Bond status scoring
-        bond_scores = pd.Series([0] * len(merged), index=merged.index)
-        bond_status = merged.get('bond_status', '').str.lower().fillna('')
-        bond_scores += bond_status.str.contains('active|valid').astype(int)
+        bond_scores = pd.Series(np.zeros(len(df), dtype=np.int8), index=df.index)
+        bond_scores += _category_contains(df, 'bond_status', _BOND_VALID_RE).astype(np.int8)
 
         # Bond amount scoring
-        bond_amount = pd.to_numeric(merged.get('bond_amount', 0), errors='coerce').fillna(0)
-        bond_scores += (bond_amount >= 75000).astype(int)
+        bond_amount = _numeric(df, 'bond_amount', 0)
+        bond_scores += (bond_amount >= 75000).astype(np.int8)
 
         return (base_scores + authority_scores + bond_scores).clip(0, 5)
 
-    def _calculate_safety_score(self, census_df: pd.DataFrame, sms_df: Optional[pd.DataFrame]) -> pd.Series:
+    def _calculate_safety_score(self, df: pd.DataFrame, flags: Dict[str, Any]) -> pd.Series:
         """Calculate safety/compliance score - higher scores for carriers needing improvement."""
-        base_scores = pd.Series([3] * len(census_df), index=census_df.index)
+        base_scores = pd.Series(np.full(len(df), 3, dtype=np.int8), index=df.index)
 
-        if sms_df is None or 'dot_number' not in sms_df.columns:
+        if not flags['has_safety_rating']:
             return base_scores
 
-        # Merge SMS data
-        merged = census_df[['dot_number']].merge(
-            sms_df[['dot_number', 'safety_rating', 'total_inspections'] +
-                   [f"{basic.lower().replace(' ', '_')}_score" for basic in self.safety_basics.keys()]],
-            on='dot_number', how='left'
-        )
-
         # Safety rating scoring
-        safety_scores = pd.Series([0] * len(merged), index=merged.index)
-        safety_rating = merged.get('safety_rating', '').str.lower().fillna('')
-        safety_scores += safety_rating.str.contains('unsatisfactory').astype(int) * 2
-        safety_scores += safety_rating.str.contains('conditional').astype(int)
+        safety_scores = pd.Series(np.zeros(len(df), dtype=np.int8), index=df.index)
+        safety_scores += _category_contains(df, 'safety_rating', 'unsatisfactory').astype(np.int8) * 2
+        safety_scores += _category_contains(df, 'safety_rating', 'conditional').astype(np.int8)
 
         # BASIC scores (average of all available BASIC categories)
-        basic_columns = [col for col in merged.columns if '_score' in col]
+        basic_columns = _resolve_basic_columns(frozenset(df.columns))
         if basic_columns:
-            basic_scores = merged[basic_columns].apply(pd.to_numeric, errors='coerce').mean(axis=1).fillna(0)
-            safety_scores += (basic_scores >= 3).astype(int)
-            safety_scores += ((basic_scores >= 2) & (basic_scores < 3)).astype(int) * 0.5
+            basic_scores = _basic_mean(df, basic_columns)
+            safety_scores += (basic_scores >= 3).astype(np.int8)
+            safety_scores += ((basic_scores >= 2) & (basic_scores < 3)).astype(np.int8) * 0.5
 
         # Inspection activity scoring
-        inspections = pd.to_numeric(merged.get('total_inspections', 0), errors='coerce').fillna(0)
-        inspection_scores = pd.cut(inspections, bins=[0, 20, 50, float('inf')],
-                                 labels=[0, 0.5, 1], include_lowest=True).astype(float)
+        inspections = _numeric(df, 'total_inspections', 0)
+        inspection_scores = _INSPECTION_POINTS[np.searchsorted(_INSPECTION_EDGES, inspections, side='left')]
 
-        return (base_scores + safety_scores + inspection_scores).clip(upper=5)
+        return (base_scores + safety_scores + inspection_scores).clip(upper=5).astype(np.float32)
 
-    def _calculate_contact_score(self, census_df: pd.DataFrame) -> pd.Series:
+    def _calculate_contact_score(self, df: pd.DataFrame, flags: Dict[str, Any]) -> pd.Series:
         """Calculate contact quality score for outreach readiness."""
-        score = pd.Series([0] * len(census_df), index=census_df.index)
+        score = pd.Series(np.zeros(len(df), dtype=np.int8), index=df.index)
 
         # Email scoring (vectorized)
-        email = census_df.get('email', '').str.strip().fillna('')
-        email_valid = email.str.contains(r'^[^@]+@[^@]+\.[^@]+$', regex=True)
-        score += email_valid.astype(int) * 2
-        score += (email_valid & email.str.endswith('.com')).astype(int) * 0.5
+        if flags['has_email']:
+            email = df['email'].str.strip().fillna('')
+            email_valid = pd.Series(_contains(email, _EMAIL_RE), index=df.index)
+            score += email_valid.astype(np.int8) * 2
+            score += (email_valid & email.str.endswith('.com')).astype(np.int8) * 0.5
 
         # Phone scoring (vectorized)
-        phone_digits = census_df.get('phone', '').str.replace(r'\D', '', regex=True).fillna('')
-        phone_scores = pd.cut(phone_digits.str.len(), bins=[0, 7, 10, float('inf')],
-                             labels=[0, 1, 2], include_lowest=True).astype(int)
-        score += phone_scores
+        if flags['has_phone']:
+            phone_scores = np.searchsorted(_PHONE_EDGES, _digit_counts(df['phone']), side='left').astype(np.int8)
+            score += phone_scores
 
         # Address completeness (vectorized)
-        address_fields = ['phy_city', 'phy_state', 'phy_zip']
-        address_complete = census_df[address_fields].notna() & (census_df[address_fields].astype(str).str.strip() != '')
-        score += address_complete.sum(axis=1)
+        address_complete = np.zeros(len(df), dtype=np.int8)
+        for field in flags['address_fields']:
+            address_complete += _is_filled(df[field]).view(np.int8)
+        score += address_complete
 
-        return score.clip(upper=5)
+        return score.clip(upper=5).astype(np.float32)
 
-    def _calculate_specialization_score(self, census_df: pd.DataFrame) -> pd.Series:
+    def _calculate_specialization_score(self, df: pd.DataFrame, flags: Dict[str, Any]) -> pd.Series:
         """Calculate specialization value score based on cargo types."""
-        cargo_carried = census_df.get('cargo_carried', '').str.lower().fillna('')
-        scores = pd.Series([1] * len(census_df), index=census_df.index)  # Base score
+        if not flags['has_cargo']:
+            return pd.Series(np.ones(len(df), dtype=np.float32), index=df.index)
 
-        # Vectorized scoring for high-value cargo
-        for category, keywords in self.high_value_cargo.items():
-            pattern = '|'.join(keywords)
-            matches = cargo_carried.str.contains(pattern, regex=True)
-
-            if category == 'hazardous_materials':
-                scores += matches.astype(int) * 2
-            elif category == 'specialized':
-                scores += matches.astype(int) * 1.5
-            elif category in ['valuable', 'time_sensitive']:
-                scores += matches.astype(int)
-
-        # Additional specialization bonuses
-        scores += cargo_carried.str.contains('intermodal').astype(int) * 0.5
-        scores += cargo_carried.str.contains('international').astype(int) * 0.5
+        # Cargo descriptions repeat heavily, so scan each distinct value once and broadcast
+        codes, uniques = pd.factorize(df['cargo_carried'])
+        bonus = np.array([self._cargo_bonus(text) for text in uniques], dtype=np.float32)
+        scores = pd.Series(1 + bonus[codes], index=df.index)  # Base score of 1
 
         return scores.clip(upper=5)
 
-    def _calculate_recency_score(self, census_df: pd.DataFrame) -> pd.Series:
+    @functools.cached_property
+    def _cargo_union(self) -> re.Pattern:
+        """
+        All cargo keywords as one alternation with a named group per category, so a
+        single scan of each cargo description finds every category it mentions.
+        """
+        cargo_keywords = dict(self.high_value_cargo, intermodal=['intermodal'], international=['international'])
+        return re.compile('|'.join(
+            f"(?P<{category}>{'|'.join(map(re.escape, keywords))})"
+            for category, keywords in cargo_keywords.items()
+        ))
+
+    @functools.cached_property
+    def _cargo_bonus(self) -> Callable[[str], float]:
+        """Per-description specialization bonus, memoized across calls on this scorer."""
+        cargo_union = self._cargo_union
+
+        @functools.lru_cache(maxsize=_CARGO_CACHE_SIZE)
+        def cargo_bonus(text: str) -> float:
+            categories = {match.lastgroup for match in cargo_union.finditer(text)}
+            return sum(_CARGO_BONUS[category] for category in categories)
+
+        return cargo_bonus
+
+    def _calculate_recency_score(self, df: pd.DataFrame, flags: Dict[str, Any]) -> pd.Series:
         """Calculate recency score - newer companies get higher scores for lead gen."""
-        add_date = pd.to_datetime(census_df.get('add_date'), errors='coerce')
-        days_since_registration = (pd.Timestamp.now() - add_date).dt.days
+        if not flags['has_add_date']:
+            return pd.Series(np.full(len(df), 3, dtype=np.float32), index=df.index)
+
+        # Whole-day arithmetic on datetime64[D]; no nanosecond timestamps or Timedelta column
+        add_date = pd.to_datetime(df['add_date'], errors='coerce', cache=True).to_numpy(dtype='datetime64[D]')
+        age = np.datetime64(date.today(), 'D') - add_date
+        days_since_registration = age.view(np.int64)
 
         # Vectorized scoring based on registration recency
-        scores = pd.cut(days_since_registration, bins=[0, 30, 90, 365, 730, float('inf')],
-                       labels=[5, 4, 3, 2, 1], include_lowest=True).astype(float)
+        scores = _RECENCY_POINTS[np.searchsorted(_RECENCY_EDGES, days_since_registration, side='left')]
 
-        # Fill NaN values (missing dates) with neutral score
-        return scores.fillna(3)
+        # Missing or future-dated registrations get a neutral score
+        unknown = np.isnat(age) | (days_since_registration < 0)
+        return pd.Series(np.where(unknown, np.float32(3), scores), index=df.index)
 
     def get_scoring_summary(self, scored_df: pd.DataFrame) -> Dict[str, Any]:
         """Generate a concise scoring summary."""
@@ -262,10 +524,20 @@ class FMCALeadScorer:
         }
 
     def get_top_leads(self, scored_df: pd.DataFrame, max_leads: int = 50) -> pd.DataFrame:
-        """Get top-scoring leads ready for outreach."""
-        top_leads = scored_df[
-            scored_df['lead_tier'].isin(['Top Tier', 'High Priority'])
-        ].head(max_leads).copy()
+        """Get top-scoring leads ready for outreach, highest composite score first."""
+        eligible = np.flatnonzero(scored_df['lead_tier'].isin(['Top Tier', 'High Priority']).to_numpy())
+        scores = scored_df['composite_score'].to_numpy()[eligible]
+
+        # Select the best max_leads in O(n), then sort just that slice
+        if max_leads <= 0:
+            keep = np.empty(0, dtype=np.intp)
+        elif len(eligible) > max_leads:
+            keep = np.argpartition(-scores, max_leads - 1)[:max_leads]
+        else:
+            keep = np.arange(len(eligible))
+        keep = keep[np.lexsort((eligible[keep], -scores[keep]))]  # Score desc, ties in frame order
+
+        top_leads = scored_df.iloc[eligible[keep]].copy()
 
         # Add simple priority notes
         top_leads['priority'] = top_leads['lead_tier'].map({
@@ -276,6 +548,19 @@ class FMCALeadScorer:
         return top_leads
 
 
+def _load_csv(path: Path, columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Read a scoring input, keeping only ``columns`` if given and loading status text as categoricals."""
+    header = pd.read_csv(path, nrows=0).columns
+    usecols = [col for col in header if col in columns] if columns else None
+    dtype = {col: 'category' for col in _CATEGORY_COLS if col in header}
+
+    if pa is not None:
+        # Arrow-backed columns keep numeric casts in Arrow kernels. The pyarrow engine
+        # mishandles a partial dtype mapping, so categorize after the read.
+        return pd.read_csv(path, engine='pyarrow', dtype_backend='pyarrow', usecols=usecols).astype(dtype)
+    return pd.read_csv(path, low_memory=False, usecols=usecols, dtype=dtype)
+
+
 def score_leads_template(census_path: Path,
                         sms_path: Optional[Path] = None,
                         li_path: Optional[Path] = None,
@@ -299,16 +584,17 @@ def score_leads_template(census_path: Path,
 
     # Load data
     logger.info("Loading FMCSA datasets for lead scoring...")
-    census_df = pd.read_csv(census_path, low_memory=False)
+    census_df = _load_csv(census_path)
 
     sms_df = None
     if sms_path and sms_path.exists():
-        sms_df = pd.read_csv(sms_path, low_memory=False)
+        # Only pull the columns the scorer uses; the SMS extract is wide
+        sms_df = _load_csv(sms_path, FMCALeadScorer._SMS_COLS)
         logger.info(f"Loaded SMS data: {len(sms_df)} records")
 
     li_df = None
     if li_path and li_path.exists():
-        li_df = pd.read_csv(li_path, low_memory=False)
+        li_df = _load_csv(li_path, FMCALeadScorer._LI_COLS)
         logger.info(f"Loaded L&I data: {len(li_df)} records")
 
     # Initialize scorer and calculate scores
@@ -322,7 +608,7 @@ def score_leads_template(census_path: Path,
     top_leads = scorer.get_top_leads(scored_leads)
     timestamp = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
     leads_path = output_dir / f"top_leads_{timestamp}.csv"
-    top_leads.to_csv(leads_path, index=False)
+    write_csv(top_leads, leads_path)
 
     logger.info("Lead scoring complete!")
     logger.info(f"Total leads scored: {len(scored_leads)}")
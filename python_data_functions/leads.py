@@ -4,29 +4,174 @@ Basic lead filtering and generation tools.
 Advanced scoring functionality moved to lead_scoring.py
 """
 
-import pandas as pd
+from __future__ import annotations
+
+import numpy as np
+import functools
+import importlib
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import multiprocessing
+import os
 
 # Handle both relative and absolute imports
 try:
-    from .parsers import FMCSACensusParser
-    from .utils import export_to_multiple_formats
+    from .consts import OUTPUT_CONFIG
 except ImportError:
-    from parsers import FMCSACensusParser
-    from utils import export_to_multiple_formats
+    from consts import OUTPUT_CONFIG
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .parsers import FMCSACensusParser
 
 logger = logging.getLogger(__name__)
 
 
+# pandas and the parser/export modules (which import pandas) are loaded on first
+# use, so importing this module, e.g. to construct a generator and fail fast on
+# missing census data, does not pay for pandas
+def _pd():
+    """The pandas module, imported on first call."""
+    import pandas
+    return pandas
+
+
+def _sibling(name: str):
+    """A sibling module of this package, imported on first call."""
+    if __package__:
+        return importlib.import_module(f".{name}", __package__)
+    return importlib.import_module(name)
+
+# Lower edges of right-closed buckets and the score each bucket maps to; values
+# at or below the lowest edge fall outside every bucket, as they did with pd.cut
+_FLEET_EDGES = np.array([0, 1, 5, 20, 100], dtype=np.float64)
+_FLEET_POINTS = np.array([1, 2, 3, 4, 5], dtype=np.float64)
+_SAFETY_EDGES = np.array([0, 1, 2, 3, 4], dtype=np.float64)
+_SAFETY_POINTS = np.array([5, 4, 3, 2, 1], dtype=np.float64)
+_SCORE_DIST_EDGES = np.array([0, 2, 3, 4, 5], dtype=np.float64)
+_SCORE_DIST_MAX = 6.0
+_SCORE_DIST_LABELS = ('Poor', 'Below Average', 'Average', 'Good', 'Excellent')
+
+# Score column and the weight applied to it in the composite score
+_COMPOSITE_WEIGHTS = (
+    ('fleet_size_score', 'fleet_size'),
+    ('company_age_score', 'company_age'),
+    ('safety_lead_score', 'safety_score'),
+)
+
+# Rows per block in the fused scoring pass; keeps each block's temporaries in L2
+_SCORE_BLOCK = 1 << 15
+
+
+def _bucket_index(values: np.ndarray, edges: np.ndarray, upper: float = np.inf) -> np.ndarray:
+    """Bucket of each value in (edges[i], edges[i + 1]], the last closed at upper; -1 outside."""
+    idx = np.searchsorted(edges, values, side='left') - 1
+    idx[~((values > edges[0]) & (values <= upper))] = -1
+    return idx
+
+
+def _bucket_scores(values: np.ndarray, edges: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Map values onto bucket points, NaN where no bucket applies."""
+    idx = _bucket_index(values, edges)
+    return np.where(idx >= 0, points[idx], np.nan)
+
+
+def _is_sorted_desc(values: np.ndarray) -> bool:
+    """True when values are non-increasing with any NaNs at the end."""
+    valid = ~np.isnan(values)
+    head = values[:int(valid.sum())]
+    return bool(valid[:len(head)].all() and np.all(head[:-1] >= head[1:]))
+
+
+def _fused_scores(n_rows: int, fleet: Optional[np.ndarray], age: Optional[np.ndarray],
+                  safety: Optional[np.ndarray], weights: Dict[str, float]) -> Dict[str, np.ndarray]:
+    """
+    Fleet, age and safety lead scores plus their weighted composite, in one blocked pass.
+
+    Each block's bucket indices and masks are computed and consumed while still in
+    cache, rather than materialising every temporary over the whole frame. Inputs
+    passed as None get no score array and contribute a neutral 3 to the composite.
+    """
+    inputs = (('fleet_size_score', fleet), ('company_age_score', age), ('safety_lead_score', safety))
+    scores = {column: np.empty(n_rows) for column, values in inputs if values is not None}
+    composite = np.empty(n_rows)
+    weighted = np.empty(min(n_rows, _SCORE_BLOCK))
+
+    for start in range(0, n_rows, _SCORE_BLOCK):
+        block = slice(start, min(start + _SCORE_BLOCK, n_rows))
+
+        if fleet is not None:
+            scores['fleet_size_score'][block] = _bucket_scores(fleet[block], _FLEET_EDGES, _FLEET_POINTS)
+        if age is not None:
+            ages = age[block]
+            scores['company_age_score'][block] = np.where(np.isnan(ages), 3.0, np.maximum(1.0, 6.0 - ages))
+        if safety is not None:
+            # Neutral score for missing data
+            values = safety[block]
+            values = np.where(np.isnan(values), 2.5, values)
+            scores['safety_lead_score'][block] = _bucket_scores(values, _SAFETY_EDGES, _SAFETY_POINTS)
+
+        # Same operation order, and so the same rounding, as the plain weighted sum
+        acc = composite[block]
+        tmp = weighted[:len(acc)]
+        acc.fill(0)
+        for column, weight in _COMPOSITE_WEIGHTS:
+            component = scores[column][block] if column in scores else 3
+            np.multiply(component, weights[weight], out=tmp)
+            acc += tmp
+
+    scores['composite_score'] = composite
+    return scores
+
+
+@functools.lru_cache(maxsize=128)
+def _norm_states(states: Tuple[str, ...]) -> FrozenSet[str]:
+    """Uppercased state codes, built once per distinct state selection."""
+    return frozenset(s.upper() for s in states)
+
+
+def _census_parser(census_file: Path) -> FMCSACensusParser:
+    """
+    Parser for a census file, preferring a Parquet copy of a CSV census.
+
+    The copy sits beside the CSV and is rebuilt whenever the CSV is newer, so
+    repeated lead runs against the same census skip the CSV parse.
+    """
+    census_file = Path(census_file)
+    if census_file.suffix.lower() != '.csv':
+        return _sibling('parsers').FMCSACensusParser(census_file)
+
+    cache_path = census_file.with_suffix(f".{OUTPUT_CONFIG['cache_format']}")
+    if cache_path.exists() and cache_path.stat().st_mtime >= census_file.stat().st_mtime:
+        logger.info(f"Using cached census: {cache_path}")
+        return _sibling('parsers').FMCSACensusParser(cache_path)
+
+    parser = _sibling('parsers').FMCSACensusParser(census_file)
+    # Write beside the cache and swap in, so readers never see a partial file
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        parser.df.to_parquet(tmp_path, compression=OUTPUT_CONFIG["cache_compression"])
+        tmp_path.replace(cache_path)
+        logger.info(f"Cached census as {cache_path}")
+    except (ImportError, OSError, ValueError, TypeError) as e:
+        # No pyarrow, a read-only or full data directory, or columns Arrow cannot convert;
+        # the CSV parsed fine, so carry on without the cache
+        logger.warning(f"Parquet cache unavailable ({e}); using {census_file}")
+        tmp_path.unlink(missing_ok=True)
+    return parser
+
+
 class FMCALeadGenerator:
     """Basic lead generation for carriers and brokers using FMCSA census data."""
 
-    def __init__(self, census_file: Optional[Path] = None):
-        """Initialize with census data file."""
+    def __init__(self, census_file: Optional[Path] = None, sms_file: Optional[Path] = None):
+        """Initialize with census data file and optional SMS safety data."""
         self.census_file = census_file
-        self.census_parser = FMCSACensusParser(census_file) if census_file else None
+        self.census_parser = _census_parser(census_file) if census_file else None
+        self.sms_parser = _sibling('parsers').FMCSASMSParser(sms_file) if sms_file else None
 
     def filter_carriers(self, states: Optional[List[str]] = None,
                        equipment_types: Optional[List[str]] = None,
@@ -35,28 +180,37 @@ class FMCALeadGenerator:
         if not self.census_parser:
             raise ValueError("Census data required")
 
-        carriers = self.census_parser.filter_carriers()
-        carriers = self.census_parser.filter_by_fleet_size(min_fleet_size)
+        pd = _pd()
+
+        # Every criterion is a mask over the one parsed census frame, applied in a single selection
+        df = self.census_parser.df
+        if 'fleet_size' in df.columns:
+            fleet_size = pd.to_numeric(df['fleet_size'], errors='coerce').fillna(0)
+        else:
+            fleet_size = pd.Series(0, index=df.index)
+
+        mask = self.census_parser.carrier_mask(df) & (fleet_size >= min_fleet_size)
 
         if states:
-            carriers = carriers[carriers['phy_state'].str.upper().isin([s.upper() for s in states])]
+            mask &= self.census_parser.phy_state_upper.isin(_norm_states(tuple(states)))
 
         if equipment_types:
-            carriers = self.census_parser.filter_equipment_types(equipment_types)
+            mask &= self.census_parser.equipment_mask(df, equipment_types)
 
-        return carriers
+        return df.loc[mask].assign(fleet_size=fleet_size[mask])
 
     def filter_brokers(self, states: Optional[List[str]] = None) -> pd.DataFrame:
         """Filter brokers by basic criteria."""
         if not self.census_parser:
             raise ValueError("Census data required")
 
-        brokers = self.census_parser.filter_brokers()
+        df = self.census_parser.df
+        mask = self.census_parser.broker_mask(df)
 
         if states:
-            brokers = brokers[brokers['phy_state'].str.upper().isin([s.upper() for s in states])]
+            mask &= self.census_parser.phy_state_upper.isin(_norm_states(tuple(states)))
 
-        return brokers
+        return df.loc[mask]
 
     def get_contact_info(self) -> pd.DataFrame:
         """Get contact information for leads."""
@@ -64,51 +218,18 @@ class FMCALeadGenerator:
             raise ValueError("Census data required")
         return self.census_parser.get_contact_info()
 
+    @functools.cached_property
+    def _contacts_by_dot(self) -> pd.DataFrame:
+        """Contact info indexed by dot_number, built once so every lead join reuses the index."""
+        return self.get_contact_info().set_index('dot_number')
 
-# Convenience functions for common use cases
-def generate_carrier_leads_by_region(census_file: Path,
-                                   states: List[str],
-                                   equipment_types: Optional[List[str]] = None,
-                                   output_dir: Optional[Path] = None) -> Dict[str, Path]:
-    """Convenience function to generate carrier leads for specific regions."""
-    output_dir = output_dir or Path("./data/processed")
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    generator = FMCALeadGenerator(census_file)
-    leads = generator.filter_carriers(states=states, equipment_types=equipment_types)
-
-    # Add contact info
-    contacts = generator.get_contact_info()
-    leads_with_contacts = leads.merge(contacts, on='dot_number', how='left')
-
-    # Export
-    timestamp = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"carrier_leads_{'_'.join(states).lower()}_{timestamp}.csv"
-    leads_with_contacts.to_csv(output_path, index=False)
-
-    return {"csv": output_path}
-
-
-def generate_broker_leads_by_region(census_file: Path,
-                                  states: List[str],
-                                  output_dir: Optional[Path] = None) -> Dict[str, Path]:
-    """Convenience function to generate broker leads for specific regions."""
-    output_dir = output_dir or Path("./data/processed")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    @functools.cached_property
+    def _safety_map(self) -> pd.Series:
+        """Numeric avg_safety_score indexed by dot_number (first rating per carrier), read once."""
+        ratings = self.sms_parser.get_safety_ratings().drop_duplicates('dot_number')
+        return _pd().to_numeric(ratings.set_index('dot_number')['avg_safety_score'], errors='coerce')
 
-    generator = FMCALeadGenerator(census_file)
-    leads = generator.filter_brokers(states=states)
-
-    # Add contact info
-    contacts = generator.get_contact_info()
-    leads_with_contacts = leads.merge(contacts, on='dot_number', how='left')
-
-    # Export
-    timestamp = pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")
-    output_path = output_dir / f"broker_leads_{'_'.join(states).lower()}_{timestamp}.csv"
-    leads_with_contacts.to_csv(output_path, index=False)
-
-    return {"csv": output_path}
+    def score_leads_comprehensive(self,
                                 leads_df: pd.DataFrame,
                                 weights: Optional[Dict[str, float]] = None) -> pd.DataFrame:
         """
@@ -121,7 +242,10 @@ def generate_broker_leads_by_region(census_file: Path,
         Returns:
             Leads with comprehensive scoring
         """
-        scored_leads = leads_df.copy()
+        pd = _pd()
+
+        # Scores are collected here and added in one assign, leaving leads_df's columns uncopied
+        new_cols: Dict[str, Any] = {}
 
         # Default weights
         default_weights = {
@@ -133,61 +257,47 @@ def generate_broker_leads_by_region(census_file: Path,
 
         weights = weights or default_weights
 
+        # Numeric inputs of the three scored components, which _fused_scores turns into
+        # the score columns below; a component left as None keeps its neutral score
+        fleet = age = safety = None
+
         # Fleet size score (larger fleets = higher score)
-        if 'fleet_size' in scored_leads.columns:
-            scored_leads['fleet_size_score'] = pd.cut(
-                pd.to_numeric(scored_leads['fleet_size'], errors='coerce').fillna(0),
-                bins=[0, 1, 5, 20, 100, float('inf')],
-                labels=[1, 2, 3, 4, 5]
-            ).astype(float)
-        else:
-            scored_leads['fleet_size_score'] = 3  # Neutral score
+        new_cols['fleet_size_score'] = 3
+        if 'fleet_size' in leads_df.columns:
+            # Unparseable sizes count as 0, which falls below every bucket
+            fleet = pd.to_numeric(leads_df['fleet_size'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
 
         # Company age score (newer companies = higher score for lead gen)
-        if 'add_date' in scored_leads.columns:
+        if 'add_date' in leads_df.columns:
             try:
-                scored_leads['add_date'] = pd.to_datetime(scored_leads['add_date'], errors='coerce')
-                max_date = scored_leads['add_date'].max()
-                scored_leads['company_age_years'] = (max_date - scored_leads['add_date']).dt.days / 365.25
-                scored_leads['company_age_score'] = scored_leads['company_age_years'].apply(
-                    lambda x: max(1, 6 - x) if pd.notna(x) else 3
-                )
+                add_date = pd.to_datetime(leads_df['add_date'], errors='coerce')
+                new_cols['add_date'] = add_date
+                # Whole days since each add date, in years, taken straight from the timedelta
+                # values rather than through .dt.days and another Series
+                elapsed = (add_date.max() - add_date).to_numpy()
+                age = elapsed.astype('timedelta64[D]').astype(np.float64) / 365.25
+                age[np.isnat(elapsed)] = np.nan
+                new_cols['company_age_years'] = age
             except:
-                scored_leads['company_age_score'] = 3
-        else:
-            scored_leads['company_age_score'] = 3
+                age = None
+        new_cols['company_age_score'] = 3
 
         # Safety score (lower risk = higher score)
         if self.sms_parser:
             try:
-                safety_data = self.sms_parser.get_safety_ratings()
-                scored_leads = scored_leads.merge(
-                    safety_data[['dot_number', 'avg_safety_score']],
-                    on='dot_number',
-                    how='left'
-                )
-
-                # Convert safety score to lead score (lower safety score = higher lead score)
-                scored_leads['safety_lead_score'] = pd.cut(
-                    scored_leads['avg_safety_score'].fillna(2.5),  # Neutral score for missing data
-                    bins=[0, 1, 2, 3, 4, float('inf')],
-                    labels=[5, 4, 3, 2, 1]
-                ).astype(float)
+                safety = leads_df['dot_number'].map(self._safety_map).to_numpy(dtype='float64', na_value=np.nan)
+                new_cols['avg_safety_score'] = safety
             except Exception as e:
                 logger.warning(f"Could not incorporate safety data: {e}")
-                scored_leads['safety_lead_score'] = 3
-        else:
-            scored_leads['safety_lead_score'] = 3
+        new_cols['safety_lead_score'] = 3
 
-        # Calculate composite score
-        scored_leads['composite_score'] = (
-            scored_leads['fleet_size_score'] * weights['fleet_size'] +
-            scored_leads['company_age_score'] * weights['company_age'] +
-            scored_leads['safety_lead_score'] * weights['safety_score']
-        )
+        # Component scores and the composite in one blocked pass over the inputs
+        new_cols.update(_fused_scores(len(leads_df), fleet, age, safety, weights))
 
-        # Sort by composite score
-        scored_leads = scored_leads.sort_values('composite_score', ascending=False)
+        # Sort by composite score: a stable descending order taken from the score array, so the
+        # wide frame is permuted exactly once (NaN scores sort last, as with sort_values)
+        scored_leads = leads_df.assign(**new_cols)
+        scored_leads = scored_leads.iloc[np.argsort(-new_cols['composite_score'], kind='stable')]
 
         return scored_leads
 
@@ -211,13 +321,13 @@ def generate_broker_leads_by_region(census_file: Path,
         logger.info(f"Finding {lead_type} leads in states: {target_states}")
 
         if lead_type == 'carrier':
-            leads = self.generate_carrier_leads(
-                region_states=target_states,
+            leads = self.filter_carriers(
+                states=target_states,
                 equipment_types=equipment_types,
                 min_fleet_size=min_fleet_size
             )
         elif lead_type == 'broker':
-            leads = self.generate_broker_leads(region_states=target_states)
+            leads = self.filter_brokers(states=target_states)
         else:
             raise ValueError("lead_type must be 'carrier' or 'broker'")
 
@@ -243,8 +353,8 @@ def generate_broker_leads_by_region(census_file: Path,
         """
         logger.info(f"Finding carriers with equipment: {equipment_types}")
 
-        leads = self.generate_carrier_leads(
-            region_states=region_states,
+        leads = self.filter_carriers(
+            states=region_states,
             equipment_types=equipment_types,
             min_fleet_size=min_fleet_size
         )
@@ -269,17 +379,6 @@ def generate_broker_leads_by_region(census_file: Path,
         Returns:
             Dictionary of exported file paths
         """
-        if include_contact_info:
-            # Get contact information
-            if self.census_parser:
-                contact_df = self.census_parser.get_contact_info()
-                leads_df = leads_df.merge(
-                    contact_df,
-                    on='dot_number',
-                    how='left',
-                    suffixes=('', '_contact')
-                )
-
         # Select columns for outreach
         outreach_columns = [
             'dot_number', 'legal_name', 'dba_name', 'composite_score',
@@ -287,15 +386,27 @@ def generate_broker_leads_by_region(census_file: Path,
             'email', 'clean_phone', 'contact_name', 'carrier_operation'
         ]
 
-        # Only include columns that exist
+        # Only include columns that exist, projecting before the join so it moves no unused columns
+        leads_df = leads_df[[col for col in outreach_columns if col in leads_df.columns]]
+
+        if include_contact_info:
+            # Get contact information; fields the leads already carry keep the lead's value
+            if self.census_parser:
+                contacts = self._contacts_by_dot
+                contact_columns = [col for col in outreach_columns
+                                   if col in contacts.columns and col not in leads_df.columns]
+                leads_df = leads_df.join(contacts[contact_columns], on='dot_number', how='left')
+
         available_columns = [col for col in outreach_columns if col in leads_df.columns]
-        outreach_df = leads_df[available_columns].copy()
+        outreach_df = leads_df[available_columns]
 
-        # Sort by score for priority outreach
-        outreach_df = outreach_df.sort_values('composite_score', ascending=False)
+        # Sort by score for priority outreach; scored leads already arrive in that order
+        scores = outreach_df['composite_score'].to_numpy(dtype='float64', na_value=np.nan)
+        if not _is_sorted_desc(scores):
+            outreach_df = outreach_df.iloc[np.argsort(-scores, kind='stable')]
 
         # Export in multiple formats
-        return export_to_multiple_formats(outreach_df, output_path, ['csv', 'xlsx'])
+        return _sibling('utils').export_to_multiple_formats(outreach_df, output_path, ['csv', 'xlsx'])
 
     def get_lead_generation_report(self, leads_df: pd.DataFrame) -> Dict:
         """
@@ -307,52 +418,44 @@ def generate_broker_leads_by_region(census_file: Path,
         Returns:
             Summary statistics dictionary
         """
+        pd = _pd()
+
+        # One value_counts pass serves both the state coverage and the top states
+        state_counts = leads_df.get('phy_state', pd.Series()).value_counts()
+
         report = {
             'total_leads': len(leads_df),
-            'avg_fleet_size': leads_df.get('fleet_size', pd.Series()).mean(),
-            'states_covered': leads_df.get('phy_state', pd.Series()).nunique(),
-            'top_states': leads_df.get('phy_state', pd.Series()).value_counts().head(5).to_dict(),
+            'avg_fleet_size': pd.to_numeric(leads_df.get('fleet_size', pd.Series()), errors='coerce').mean(),
+            'states_covered': int((state_counts > 0).sum()),
+            'top_states': state_counts.head(5).to_dict(),
             'score_distribution': None,
             'contact_info_available': 0
         }
 
         # Score distribution
         if 'composite_score' in leads_df.columns:
-            score_dist = pd.cut(
-                leads_df['composite_score'],
-                bins=[0, 2, 3, 4, 5, 6],
-                labels=['Poor', 'Below Average', 'Average', 'Good', 'Excellent']
-            ).value_counts().to_dict()
-            report['score_distribution'] = score_dist
+            scores = leads_df['composite_score'].to_numpy(dtype='float64', na_value=np.nan)
+            idx = _bucket_index(scores, _SCORE_DIST_EDGES, _SCORE_DIST_MAX)
+            counts = np.bincount(idx[idx >= 0], minlength=len(_SCORE_DIST_LABELS))
+            report['score_distribution'] = dict(zip(_SCORE_DIST_LABELS, counts.tolist()))
 
         # Contact info availability
-        contact_fields = ['email', 'phone', 'contact_name']
-        available_contacts = 0
-        for field in contact_fields:
-            if field in leads_df.columns:
-                available_contacts += leads_df[field].notna().sum()
-
-        report['contact_info_available'] = available_contacts
+        contact_fields = [field for field in ('email', 'phone', 'contact_name') if field in leads_df.columns]
+        report['contact_info_available'] = int(leads_df[contact_fields].notna().to_numpy().sum())
 
         return report
 
 
-def generate_carrier_leads_by_region(census_file: Path,
-                                   states: List[str],
-                                   equipment_types: Optional[List[str]] = None,
-                                   output_dir: Optional[Path] = None) -> Dict[str, Path]:
-    """
-    Convenience function to generate carrier leads for specific regions.
-
-    Args:
-        census_file: Path to census CSV
-        states: List of state codes
-        equipment_types: Optional equipment type filter
-        output_dir: Output directory (defaults to ./data/processed)
+# Convenience functions for common use cases
+def _generate_leads_by_region(census_file: Path,
+                              states: List[str],
+                              lead_type: str,
+                              equipment_types: Optional[List[str]] = None,
+                              output_dir: Optional[Path] = None) -> Dict[str, Path]:
+    """Find, score and export leads of one type for a region; shared by the public wrappers."""
+    if lead_type not in ('carrier', 'broker'):
+        raise ValueError("lead_type must be 'carrier' or 'broker'")
 
-    Returns:
-        Dictionary of generated file paths
-    """
     output_dir = output_dir or Path("./data/processed")
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -362,25 +465,45 @@ def generate_carrier_leads_by_region(census_file: Path,
     # Generate leads
     leads = lead_gen.find_regional_leads(
         target_states=states,
-        lead_type='carrier',
+        lead_type=lead_type,
         equipment_types=equipment_types
     )
 
     # Export for outreach
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_base = output_dir / f"carrier_leads_{'_'.join(states).lower()}_{timestamp}"
+    output_base = output_dir / f"{lead_type}_leads_{'_'.join(states).lower()}_{timestamp}"
 
     exported_files = lead_gen.export_leads_for_outreach(leads, output_base)
 
     # Generate report
     report = lead_gen.get_lead_generation_report(leads)
-    logger.info("Lead Generation Report:")
+    logger.info(f"{lead_type.title()} Lead Generation Report:")
     for key, value in report.items():
         logger.info(f"  {key}: {value}")
 
     return exported_files
 
 
+def generate_carrier_leads_by_region(census_file: Path,
+                                   states: List[str],
+                                   equipment_types: Optional[List[str]] = None,
+                                   output_dir: Optional[Path] = None) -> Dict[str, Path]:
+    """
+    Convenience function to generate carrier leads for specific regions.
+
+    Args:
+        census_file: Path to census CSV
+        states: List of state codes
+        equipment_types: Optional equipment type filter
+        output_dir: Output directory (defaults to ./data/processed)
+
+    Returns:
+        Dictionary of generated file paths
+    """
+    return _generate_leads_by_region(census_file, states, 'carrier',
+                                     equipment_types=equipment_types, output_dir=output_dir)
+
+
 def generate_broker_leads_by_region(census_file: Path,
                                   states: List[str],
                                   output_dir: Optional[Path] = None) -> Dict[str, Path]:
@@ -395,28 +518,41 @@ def generate_broker_leads_by_region(census_file: Path,
     Returns:
         Dictionary of generated file paths
     """
-    output_dir = output_dir or Path("./data/processed")
-    output_dir.mkdir(parents=True, exist_ok=True)
+    return _generate_leads_by_region(census_file, states, 'broker', output_dir=output_dir)
 
-    # Initialize lead generator
-    lead_gen = FMCALeadGenerator(census_file=census_file)
 
-    # Generate leads
-    leads = lead_gen.find_regional_leads(
-        target_states=states,
-        lead_type='broker'
-    )
+def generate_leads_batch(census_file: Path,
+                         state_lists: List[List[str]],
+                         lead_type: str = 'carrier',
+                         equipment_types: Optional[List[str]] = None,
+                         output_dir: Optional[Path] = None,
+                         max_workers: Optional[int] = None) -> List[Dict[str, Path]]:
+    """
+    Generate leads for several independent regions in parallel worker processes.
 
-    # Export for outreach
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_base = output_dir / f"broker_leads_{'_'.join(states).lower()}_{timestamp}"
+    Args:
+        census_file: Path to census CSV
+        state_lists: One list of state codes per region
+        lead_type: 'carrier' or 'broker'
+        equipment_types: Optional equipment type filter (carriers only)
+        output_dir: Output directory (defaults to ./data/processed)
+        max_workers: Worker processes (defaults to one per region, up to the CPU count)
 
-    exported_files = lead_gen.export_leads_for_outreach(leads, output_base)
+    Returns:
+        Exported file paths per region, in the order of state_lists
+    """
+    if not state_lists:
+        return []
 
-    # Generate report
-    report = lead_gen.get_lead_generation_report(leads)
-    logger.info("Broker Lead Generation Report:")
-    for key, value in report.items():
-        logger.info(f"  {key}: {value}")
+    if lead_type not in ('carrier', 'broker'):
+        raise ValueError("lead_type must be 'carrier' or 'broker'")
 
-    return exported_files
+    # Build the Parquet census copy once up front, so workers read it rather than each parsing the CSV
+    census_file = _census_parser(census_file).file_path
+    worker = functools.partial(_generate_leads_by_region, census_file, lead_type=lead_type,
+                               equipment_types=equipment_types, output_dir=output_dir)
+
+    max_workers = max_workers or min(len(state_lists), os.cpu_count() or 1)
+    # spawn rather than fork: the census parse above leaves pandas/pyarrow thread pools running
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(worker, state_lists))
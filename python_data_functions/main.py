@@ -5,23 +5,28 @@ Main orchestration script for downloading and processing FMCSA carrier/broker da
 
 import argparse
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 from datetime import datetime
 
 # Handle both direct execution and module execution
 try:
     from .api import FMCSADataDownloader, FMCSAAPIClient, list_available_datasets
-    from .parsers import parse_file_to_dataframe, FMCSAInspectionParser
+    from .parsers import get_parser_for_file, FMCSAInspectionParser
     from .lead_scoring import score_leads_template
-    from .consts import RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG
+    from .consts import RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG, OUTPUT_CONFIG, validate_dot_series
 except ImportError:
     # Running directly, use absolute imports
     from api import FMCSADataDownloader, FMCSAAPIClient, list_available_datasets
-    from parsers import parse_file_to_dataframe, FMCSAInspectionParser
+    from parsers import get_parser_for_file, FMCSAInspectionParser
     from lead_scoring import score_leads_template
-    from consts import RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG
+    from consts import RAW_DIR, PROCESSED_DIR, LOGGING_CONFIG, OUTPUT_CONFIG, validate_dot_series
 
 # Setup logging
 logging.basicConfig(
@@ -34,19 +39,120 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Rows parsed and cleaned at a time when processing bulk files
+_PROCESS_CHUNK_ROWS = 500_000
+
+# Rows formatted per batch when writing processed CSV outputs
+_CSV_CHUNK_ROWS = 100_000
+
+# Downloaded dataset key -> (key in the processed datasets, FMCSABulkProcessor method)
+_AUTO_PROCESS = {
+    'MCMIS_CENSUS': ('census', 'process_census_data'),
+    'SMS_BULK': ('safety', 'process_safety_data'),
+    'INSPECTIONS': ('inspections', 'process_inspection_data'),
+}
+
+
+def _concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Stack processed chunks into one frame, keeping columns categorical where every chunk is."""
+    if len(chunks) == 1:
+        return chunks[0]
+
+    df = pd.concat(chunks, ignore_index=True)
+    for col in chunks[0].columns:
+        parts = [chunk[col] for chunk in chunks]
+        if (all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts)
+                and not isinstance(df[col].dtype, pd.CategoricalDtype)):
+            # Chunks saw different categories, which concat falls back to object for
+            df[col] = union_categoricals(parts)
+    return df
+
+
+def _cut(values: pd.Series, bins: List[float], labels: List[str]) -> pd.Categorical:
+    """
+    Ordered categorical of labels for right-closed bins, as pd.cut(values, bins, labels=labels).
+
+    One searchsorted over the values gives the bin codes directly; values outside
+    the bins, and missing values, get no label.
+    """
+    x = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    edges = np.asarray(bins, dtype=np.float64)
+    codes = np.searchsorted(edges, x, side='left') - 1
+    codes[~((x > edges[0]) & (x <= edges[-1]))] = -1
+    return pd.Categorical.from_codes(codes.astype(np.int8), categories=labels, ordered=True)
+
+
+def _row_nanmean(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    Mean of the non-missing values of columns in each row, NaN where all are missing.
+
+    Accumulates a running sum and count column by column, so no rows x columns
+    block is gathered before reducing as with df[columns].mean(axis=1).
+    """
+    total = np.zeros(len(df))
+    count = np.zeros(len(df))
+    for col in columns:
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        np.add(total, values, out=total, where=valid)
+        count += valid
+
+    mean = np.full(len(df), np.nan)
+    np.divide(total, count, out=mean, where=count > 0)
+    return mean
+
+
+def _dot_numbers(series: pd.Series) -> pd.Series:
+    """
+    DOT numbers as nullable int64, missing where a value isn't a 1-8 digit number.
+
+    Integer keys make the dot_number joins, lookups and isin checks hash
+    8-byte values instead of strings, and take half the memory.
+    """
+    return pd.to_numeric(series.where(validate_dot_series(series)), errors='coerce').astype('Int64')
+
+
+def _merge_on_dot(left: pd.DataFrame, right: pd.DataFrame, suffix: str) -> pd.DataFrame:
+    """
+    Left-join right onto left by dot_number, suffixing right's clashing column names.
+
+    When right has one row per DOT number its rows are looked up by index, which
+    skips building a hash join and its result; otherwise (e.g. a summary with a
+    row per carrier and violation) this is an ordinary merge that may fan out.
+    Rows of right without a valid DOT number are dropped first: both paths match
+    missing keys to each other, which would attach them to every bad-DOT carrier.
+    """
+    right = right.dropna(subset=['dot_number'])
+    lookup = right.set_index('dot_number')
+    if not lookup.index.is_unique:
+        return left.merge(right, on='dot_number', how='left', suffixes=('', suffix))
+
+    joined = lookup.reindex(left['dot_number'])
+    joined.index = left.index
+    joined.columns = [f"{col}{suffix}" if col in left.columns else col for col in joined.columns]
+    merged = pd.concat([left, joined], axis=1)
+    # Fresh 0..n-1 labels like merge gives, set in place rather than through a reset_index copy
+    merged.index = pd.RangeIndex(len(merged))
+    return merged
+
 
 class FMCSABulkProcessor:
     """Main processor for FMCSA bulk data operations."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, output_format: str = OUTPUT_CONFIG["processed_format"]):
         """
         Initialize the bulk processor.
 
         Args:
             api_key: FMCSA WebKey for API access (optional)
+            output_format: 'parquet' or 'csv' for processed and merged datasets
         """
         self.downloader = FMCSADataDownloader(api_key)
         self.api_client = FMCSAAPIClient(api_key) if api_key else None
+        self.output_format = output_format
+        # One date stamp for every file of the run, even one that crosses midnight;
+        # FMCSA_RUN_STAMP pins it for reproducible pipelines
+        self._run_stamp = os.environ.get("FMCSA_RUN_STAMP") or datetime.now().strftime('%Y%m%d')
 
     def download_all_datasets(self) -> Dict[str, Path]:
         """
@@ -83,19 +189,21 @@ class FMCSABulkProcessor:
         logger.info("Processing census data...")
 
         try:
-            df = parse_file_to_dataframe(census_file)
-
-            # Basic data cleaning
-            df = self._clean_census_data(df)
+            # Clean and derive columns a chunk at a time, so parsing never holds the raw file
+            # alongside its cleaned copy
+            chunks = []
+            for chunk in get_parser_for_file(census_file).parse_in_chunks(_PROCESS_CHUNK_ROWS):
+                # Basic data cleaning
+                chunk = self._clean_census_data(chunk)
 
-            # Add derived columns
-            df = self._add_census_derived_columns(df)
+                # Add derived columns
+                chunks.append(self._add_census_derived_columns(chunk))
+            df = _concat_chunks(chunks)
 
             # Generate summary statistics
             self._generate_census_summary(df)
 
-            output_path = PROCESSED_DIR / f"census_processed_{datetime.now().strftime('%Y%m%d')}.csv"
-            df.to_csv(output_path, index=False)
+            output_path = self._write_output(df, f"census_processed_{self._run_stamp}")
 
             logger.info(f"Census data processed and saved to: {output_path}")
             return df
@@ -127,16 +235,16 @@ class FMCSABulkProcessor:
                 else:
                     raise ValueError("No CSV file found in SMS ZIP archive")
 
-            df = parse_file_to_dataframe(sms_file)
-
-            # Clean and process safety data
-            df = self._clean_safety_data(df)
+            chunks = []
+            for chunk in get_parser_for_file(sms_file).parse_in_chunks(_PROCESS_CHUNK_ROWS):
+                # Clean and process safety data
+                chunk = self._clean_safety_data(chunk)
 
-            # Calculate safety scores and risk levels
-            df = self._calculate_safety_scores(df)
+                # Calculate safety scores and risk levels
+                chunks.append(self._calculate_safety_scores(chunk))
+            df = _concat_chunks(chunks)
 
-            output_path = PROCESSED_DIR / f"safety_processed_{datetime.now().strftime('%Y%m%d')}.csv"
-            df.to_csv(output_path, index=False)
+            output_path = self._write_output(df, f"safety_processed_{self._run_stamp}")
 
             logger.info(f"Safety data processed and saved to: {output_path}")
             return df
@@ -160,18 +268,20 @@ class FMCSABulkProcessor:
         try:
             parser = FMCSAInspectionParser(inspection_file)
 
-            # Get different views of the data
+            # Get different views of the data, all from one parse of the file
+            inspections = parser.parse_to_dataframe()
+            if 'dot_number' in inspections.columns:
+                # Same integer keys as the cleaned census and safety data they are merged with
+                inspections['dot_number'] = _dot_numbers(inspections['dot_number'])
             results = {
-                'all_inspections': parser.parse_to_dataframe(),
-                'food_safety_violations': parser.parse_food_safety_violations(),
-                'carrier_violation_summary': parser.get_carrier_violation_summary()
+                'all_inspections': inspections,
+                'food_safety_violations': parser.parse_food_safety_violations(inspections),
+                'carrier_violation_summary': parser.get_carrier_violation_summary(inspections)
             }
 
             # Save processed datasets
-            timestamp = datetime.now().strftime('%Y%m%d')
             for name, df in results.items():
-                output_path = PROCESSED_DIR / f"{name}_{timestamp}.csv"
-                df.to_csv(output_path, index=False)
+                output_path = self._write_output(df, f"{name}_{self._run_stamp}")
                 logger.info(f"Saved {name} to: {output_path}")
 
             return results
@@ -180,6 +290,46 @@ class FMCSABulkProcessor:
             logger.error(f"Failed to process inspection data: {e}")
             raise
 
+    def process_downloaded(self, downloaded_files: Dict[str, Path], return_data: bool = True) -> Dict[str, Any]:
+        """
+        Process downloaded census, safety and inspection files in parallel.
+
+        The datasets are independent and each is CPU-bound, so each runs in its
+        own worker process with a processor configured like this one. Every
+        worker writes its outputs to PROCESSED_DIR itself; the processed frames
+        are only sent back through the pool when return_data is set, since
+        pickling a multi-GB census to the parent doubles its memory.
+
+        Args:
+            downloaded_files: Dictionary mapping dataset keys to downloaded file paths
+            return_data: Return the processed frames (e.g. for merge_datasets)
+                rather than their row counts
+
+        Returns:
+            Processed datasets, or their row counts, keyed as merge_datasets expects;
+            failures are logged and left out
+        """
+        tasks = {key: _AUTO_PROCESS[key] for key in downloaded_files if key in _AUTO_PROCESS}
+        datasets = {}
+        if not tasks:
+            return datasets
+
+        # spawn rather than fork, so workers don't inherit pandas/pyarrow thread pool state
+        with ProcessPoolExecutor(max_workers=len(tasks), mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {
+                executor.submit(_process_in_worker, method, downloaded_files[key],
+                                self.output_format, self._run_stamp, return_data): (key, name)
+                for key, (name, method) in tasks.items()
+            }
+            for future in as_completed(futures):
+                dataset_key, name = futures[future]
+                try:
+                    datasets[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to process {dataset_key}: {e}")
+
+        return datasets
+
     def merge_datasets(self, datasets: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """
         Merge census, safety, and inspection data for comprehensive analysis.
@@ -197,35 +347,29 @@ class FMCSABulkProcessor:
             if 'census' not in datasets:
                 raise ValueError("Census data required for merging")
 
-            merged_df = datasets['census'].copy()
+            # merge builds a new frame, so the census is not copied up front
+            merged_df = datasets['census']
 
             # Merge safety data
             if 'safety' in datasets:
-                merged_df = merged_df.merge(
-                    datasets['safety'],
-                    on='dot_number',
-                    how='left',
-                    suffixes=('', '_safety')
-                )
+                merged_df = _merge_on_dot(merged_df, datasets['safety'], '_safety')
 
             # Merge inspection summary
             if 'inspections' in datasets and 'carrier_violation_summary' in datasets['inspections']:
                 violation_summary = datasets['inspections']['carrier_violation_summary']
-                merged_df = merged_df.merge(
-                    violation_summary,
-                    on='dot_number',
-                    how='left',
-                    suffixes=('', '_violations')
-                )
+                merged_df = _merge_on_dot(merged_df, violation_summary, '_violations')
 
             # Add food safety compliance indicator
             if 'inspections' in datasets and 'food_safety_violations' in datasets['inspections']:
                 fsma_violations = datasets['inspections']['food_safety_violations']
-                fsma_carriers = fsma_violations['dot_number'].unique()
-                merged_df['has_fsma_violations'] = merged_df['dot_number'].isin(fsma_carriers)
+                # isin hashes the violation DOT numbers once itself; no separate unique() pass.
+                # assign rather than setitem, so the caller's census is never modified
+                merged_df = merged_df.assign(
+                    has_fsma_violations=merged_df['dot_number'].isin(fsma_violations['dot_number'])
+                )
 
-            output_path = PROCESSED_DIR / f"comprehensive_merged_{datetime.now().strftime('%Y%m%d')}.csv"
-            merged_df.to_csv(output_path, index=False)
+            # Parquet keeps fleet_category and risk_level categorical
+            output_path = self._write_output(merged_df, f"comprehensive_merged_{self._run_stamp}")
 
             logger.info(f"Comprehensive dataset created with {len(merged_df)} carriers")
             logger.info(f"Merged data saved to: {output_path}")
@@ -236,6 +380,45 @@ class FMCSABulkProcessor:
             logger.error(f"Failed to merge datasets: {e}")
             raise
 
+    def _write_output(self, df: pd.DataFrame, stem: str) -> Path:
+        """
+        Write a processed dataset to PROCESSED_DIR in the configured output format.
+
+        Parquet is columnar and compressed, so it is smaller and much faster to
+        write and read back than CSV. CSV is written when requested, or when
+        Parquet is unavailable or the frame has columns Arrow cannot store;
+        it is zstd-compressed (.csv.zst) when the zstandard package is
+        installed, which pandas reads back transparently.
+
+        Args:
+            df: Dataset to write
+            stem: File name without extension
+
+        Returns:
+            Path of the written file
+        """
+        if self.output_format == "parquet":
+            output_path = PROCESSED_DIR / f"{stem}.parquet"
+            try:
+                df.to_parquet(output_path, index=False, compression=OUTPUT_CONFIG["cache_compression"])
+                return output_path
+            except (ImportError, TypeError, ValueError) as e:
+                logger.warning(f"Parquet output unavailable for {stem} ({e}); writing CSV")
+                output_path.unlink(missing_ok=True)
+
+        output_path = PROCESSED_DIR / f"{stem}.csv.zst"
+        try:
+            df.to_csv(output_path, index=False, chunksize=_CSV_CHUNK_ROWS,
+                      compression=OUTPUT_CONFIG["processed_csv_compression"])
+            return output_path
+        except ImportError as e:
+            logger.warning(f"zstd compression unavailable for {stem} ({e}); writing uncompressed CSV")
+            output_path.unlink(missing_ok=True)
+
+        output_path = PROCESSED_DIR / f"{stem}.csv"
+        df.to_csv(output_path, index=False, chunksize=_CSV_CHUNK_ROWS)
+        return output_path
+
     def _clean_census_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and standardize census data."""
         # Standardize column names
@@ -243,7 +426,7 @@ class FMCSABulkProcessor:
 
         # Clean DOT numbers
         if 'dot_number' in df.columns:
-            df['dot_number'] = df['dot_number'].astype(str).str.strip()
+            df['dot_number'] = _dot_numbers(df['dot_number'])
 
         # Clean carrier names
         if 'legal_name' in df.columns:
@@ -259,7 +442,7 @@ class FMCSABulkProcessor:
         """Add derived columns to census data."""
         # Fleet size categories
         if 'fleet_size' in df.columns:
-            df['fleet_category'] = pd.cut(
+            df['fleet_category'] = _cut(
                 df['fleet_size'],
                 bins=[0, 1, 5, 20, 100, float('inf')],
                 labels=['1 vehicle', '2-5 vehicles', '6-20 vehicles', '21-100 vehicles', '100+ vehicles']
@@ -295,7 +478,7 @@ class FMCSABulkProcessor:
 
         # Clean DOT numbers
         if 'dot_number' in df.columns:
-            df['dot_number'] = df['dot_number'].astype(str).str.strip()
+            df['dot_number'] = _dot_numbers(df['dot_number'])
 
         # Convert score columns to numeric
         score_columns = [col for col in df.columns if 'score' in col.lower()]
@@ -310,10 +493,10 @@ class FMCSABulkProcessor:
 
         if score_columns:
             # Calculate average safety score
-            df['avg_safety_score'] = df[score_columns].mean(axis=1)
+            df['avg_safety_score'] = _row_nanmean(df, score_columns)
 
             # Categorize risk levels
-            df['risk_level'] = pd.cut(
+            df['risk_level'] = _cut(
                 df['avg_safety_score'],
                 bins=[0, 2, 3, 4, float('inf')],
                 labels=['Low Risk', 'Moderate Risk', 'High Risk', 'Critical Risk']
@@ -322,6 +505,20 @@ class FMCSABulkProcessor:
         return df
 
 
+def _process_in_worker(method: str, file_path: Path, output_format: str, run_stamp: str,
+                       return_data: bool) -> Any:
+    """Run one FMCSABulkProcessor processing method in a worker process."""
+    processor = FMCSABulkProcessor(output_format=output_format)
+    processor._run_stamp = run_stamp
+    result = getattr(processor, method)(file_path)
+    if return_data:
+        return result
+    # Row counts only; the outputs are already on disk
+    if isinstance(result, dict):
+        return {name: len(df) for name, df in result.items()}
+    return len(result)
+
+
 def main():
     """Main function for command-line usage."""
     parser = argparse.ArgumentParser(
@@ -348,6 +545,7 @@ Examples:
     parser.add_argument("--process-safety", help="Process specific safety file")
     parser.add_argument("--process-inspections", help="Process specific inspection file")
     parser.add_argument("--merge-all", action="store_true", help="Merge all processed datasets")
+    parser.add_argument("--csv-out", action="store_true", help="Write processed datasets as CSV instead of Parquet")
 
     # Lead scoring arguments
     parser.add_argument("--score-leads", action="store_true", help="Score leads using comprehensive FMCSA data analysis")
@@ -377,7 +575,7 @@ Examples:
         return
 
     try:
-        processor = FMCSABulkProcessor(args.api_key)
+        processor = FMCSABulkProcessor(args.api_key, output_format="csv" if args.csv_out else "parquet")
 
         datasets = {}
         downloaded_files = {}
@@ -399,18 +597,11 @@ Examples:
             inspection_file = Path(args.process_inspections)
             datasets['inspections'] = processor.process_inspection_data(inspection_file)
 
-        # Auto-process downloaded files
+        # Auto-process downloaded files; the frames are only needed back for merging
         if downloaded_files:
-            for dataset_key, file_path in downloaded_files.items():
-                try:
-                    if dataset_key == 'MCMIS_CENSUS':
-                        datasets['census'] = processor.process_census_data(file_path)
-                    elif dataset_key == 'SMS_BULK':
-                        datasets['safety'] = processor.process_safety_data(file_path)
-                    elif dataset_key == 'INSPECTIONS':
-                        datasets['inspections'] = processor.process_inspection_data(file_path)
-                except Exception as e:
-                    logger.error(f"Failed to process {dataset_key}: {e}")
+            processed = processor.process_downloaded(downloaded_files, return_data=args.merge_all)
+            if args.merge_all:
+                datasets.update(processed)
 
         # Merge phase
         if args.merge_all and len(datasets) > 1:
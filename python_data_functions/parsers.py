@@ -4,22 +4,55 @@ Handles parsing of different FMCSA data file formats (CSV, fixed-width TXT, etc.
 """
 
 import pandas as pd
+import numpy as np
+import functools
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Iterator, Any, Tuple
+import contextlib
 import csv
 import re
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # multithreaded CSV reader, used when installed
+except ImportError:
+    pa = pa_csv = None
+
 # Handle both relative and absolute imports
 try:
-    from .consts import FILE_FORMATS, VALIDATION_RULES, FSMA_CONFIG
+    from .consts import (
+        FILE_FORMATS, VALIDATION_RULES, FSMA_CONFIG, CENSUS_DTYPES,
+        validate_dot_series, validate_state_series
+    )
 except ImportError:
-    from consts import FILE_FORMATS, VALIDATION_RULES, FSMA_CONFIG
+    from consts import (
+        FILE_FORMATS, VALIDATION_RULES, FSMA_CONFIG, CENSUS_DTYPES,
+        validate_dot_series, validate_state_series
+    )
 
 logger = logging.getLogger(__name__)
 
 
+def _string_types_mapper():
+    """
+    pyarrow -> pandas mapping that keeps string columns in Arrow buffers.
+
+    pandas 3 already converts Arrow strings to its Arrow-backed str dtype. On
+    pandas 2.1+ the same dtype is opt-in as "pyarrow_numpy" (NaN for missing
+    values, like object columns); older versions keep object columns.
+    """
+    major, minor = (int(part) for part in pd.__version__.split('.')[:2])
+    if pa is None or major >= 3 or (major, minor) < (2, 1):
+        return None
+    dtype = pd.StringDtype("pyarrow_numpy")
+    return {pa.string(): dtype, pa.large_string(): dtype}.get
+
+
+_STRING_TYPES_MAPPER = _string_types_mapper()
+
+
 class FMCSADataParser:
     """Base class for parsing FMCSA data files."""
 
@@ -31,6 +64,10 @@ class FMCSADataParser:
         """Parse file to pandas DataFrame."""
         raise NotImplementedError
 
+    def parse_in_chunks(self, chunk_size: int = 500_000) -> Iterator[pd.DataFrame]:
+        """Parse file as a sequence of DataFrames; formats without a chunked reader yield one frame."""
+        yield self.parse_to_dataframe()
+
     def validate_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Validate parsed data against rules."""
         validation_results = {
@@ -58,7 +95,7 @@ class FMCSADataParser:
 
         # Pattern validation
         if "pattern" in rules:
-            pattern = re.compile(rules["pattern"])
+            pattern = rules.get("compiled") or re.compile(rules["pattern"])
             invalid_count = (~series.astype(str).str.match(pattern, na=False)).sum()
             if invalid_count > 0:
                 errors.append(f"{invalid_count} values don't match pattern for {series.name}")
@@ -81,6 +118,9 @@ class FMCSADataParser:
 class FMCSACSVParser(FMCSADataParser):
     """Parser for FMCSA CSV files."""
 
+    # Per-column dtypes keyed by cleaned column name; other columns are read as str
+    dtypes: Dict[str, str] = {}
+
     def __init__(self, file_path: Path, delimiter: str = ","):
         super().__init__(file_path)
         self.delimiter = delimiter
@@ -88,27 +128,28 @@ class FMCSACSVParser(FMCSADataParser):
     def parse_to_dataframe(self) -> pd.DataFrame:
         """Parse CSV file to DataFrame with automatic type detection."""
         try:
-            logger.info(f"Parsing CSV file: {self.file_path}")
-
-            # First, try to detect the delimiter and encoding
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                sample = f.read(1024)
-                detected_delimiter = csv.Sniffer().sniff(sample).delimiter
-
-            # Use detected delimiter, but fall back to specified one
-            delimiter = detected_delimiter if detected_delimiter else self.delimiter
+            if self.file_path.suffix.lower() == '.parquet':
+                # Cached copy of an already parsed CSV (see FMCSADataDownloader.get_cached_or_download)
+                df = pd.read_parquet(self.file_path)
+                logger.info(f"Loaded {len(df)} rows with {len(df.columns)} columns from {self.file_path}")
+                return df
 
-            # Read CSV with pandas
-            df = pd.read_csv(
-                self.file_path,
-                delimiter=delimiter,
-                encoding=self.encoding,
-                low_memory=False,  # Handle large files
-                dtype=str  # Read as strings first to avoid type issues
-            )
+            logger.info(f"Parsing CSV file: {self.file_path}")
+            delimiter, dtypes = self._detect_layout()
+
+            df = self._read_with_pyarrow(delimiter, dtypes)
+            if df is None:
+                # Read CSV with pandas
+                df = pd.read_csv(
+                    self.file_path,
+                    delimiter=delimiter,
+                    encoding=self.encoding,
+                    low_memory=False,  # Handle large files
+                    dtype=dtypes  # Strings unless a column has a declared dtype
+                )
 
             # Clean column names
-            df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
+            df.columns = self._clean_columns(df.columns)
 
             logger.info(f"Parsed {len(df)} rows with {len(df.columns)} columns")
             return df
@@ -117,6 +158,110 @@ class FMCSACSVParser(FMCSADataParser):
             logger.error(f"Failed to parse CSV {self.file_path}: {e}")
             raise
 
+    def parse_in_chunks(self, chunk_size: int = 500_000) -> Iterator[pd.DataFrame]:
+        """
+        Parse CSV file as a sequence of DataFrames of up to chunk_size rows.
+
+        Each chunk has the cleaned column names and dtypes parse_to_dataframe
+        gives the whole file, so memory used while parsing is bounded by the
+        chunk rather than the file. At least one (possibly empty) chunk is
+        always yielded.
+
+        Args:
+            chunk_size: Number of rows per chunk
+        """
+        if self.file_path.suffix.lower() == '.parquet':
+            yield self.parse_to_dataframe()
+            return
+
+        logger.info(f"Parsing CSV file in chunks: {self.file_path}")
+        delimiter, dtypes = self._detect_layout()
+        columns = self._clean_columns(pd.Index(list(dtypes)))
+
+        if self._arrow_options(delimiter, dtypes) is not None:
+            chunks = self._iter_with_pyarrow(delimiter, dtypes, chunk_size)
+        else:
+            chunks = pd.read_csv(
+                self.file_path,
+                delimiter=delimiter,
+                encoding=self.encoding,
+                dtype=dtypes,
+                chunksize=chunk_size
+            )
+
+        rows = 0
+        with contextlib.closing(chunks):
+            for chunk in chunks:
+                chunk.columns = columns
+                rows += len(chunk)
+                yield chunk
+
+        logger.info(f"Parsed {rows} rows with {len(columns)} columns")
+
+    def _detect_layout(self) -> Tuple[str, Dict[str, Any]]:
+        """Delimiter of the CSV and the dtype of each raw header column."""
+        # First, try to detect the delimiter and encoding
+        with open(self.file_path, 'r', encoding=self.encoding) as f:
+            sample = f.read(1024)
+            detected_delimiter = csv.Sniffer().sniff(sample).delimiter
+
+        # Use detected delimiter, but fall back to specified one
+        delimiter = detected_delimiter if detected_delimiter else self.delimiter
+
+        # Map dtypes onto the raw header, since pandas applies them before columns are cleaned
+        header = pd.read_csv(self.file_path, delimiter=delimiter, encoding=self.encoding, nrows=0).columns
+        dtypes = {raw: self.dtypes.get(clean, str) for raw, clean in zip(header, self._clean_columns(header))}
+        return delimiter, dtypes
+
+    def _arrow_options(self, delimiter: str, dtypes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """pyarrow CSV reader options matching the pandas read; None when pyarrow can't produce the same frame."""
+        if pa_csv is None or any(dtype not in (str, "category") for dtype in dtypes.values()):
+            return None
+
+        # Same column names and types pandas would produce: str columns, categories as dictionaries
+        column_types = {
+            name: pa.dictionary(pa.int32(), pa.string()) if dtype == "category" else pa.string()
+            for name, dtype in dtypes.items()
+        }
+        return {
+            "read_options": pa_csv.ReadOptions(
+                column_names=list(dtypes), skip_rows=1, encoding=self.encoding,
+                block_size=1 << 24, use_threads=True
+            ),
+            "parse_options": pa_csv.ParseOptions(delimiter=delimiter),
+            "convert_options": pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+        }
+
+    def _read_with_pyarrow(self, delimiter: str, dtypes: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Parse with pyarrow's block-parallel reader; None when pyarrow can't produce the same frame."""
+        options = self._arrow_options(delimiter, dtypes)
+        if options is None:
+            return None
+
+        table = pa_csv.read_csv(self.file_path, **options)
+        # Arrow buffers are released column by column as pandas takes ownership; string
+        # columns stay Arrow-backed, so joins on dot_number hash contiguous UTF-8 data
+        return table.to_pandas(self_destruct=True, types_mapper=_STRING_TYPES_MAPPER)
+
+    def _iter_with_pyarrow(self, delimiter: str, dtypes: Dict[str, Any], chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Stream the CSV through pyarrow's reader, converting batches to pandas chunk_size rows at a time."""
+        reader = pa_csv.open_csv(self.file_path, **self._arrow_options(delimiter, dtypes))
+        with reader:
+            batches, rows, emitted = [], 0, False
+            for batch in reader:
+                batches.append(batch)
+                rows += batch.num_rows
+                if rows >= chunk_size:
+                    yield pa.Table.from_batches(batches).to_pandas(self_destruct=True, types_mapper=_STRING_TYPES_MAPPER)
+                    batches, rows, emitted = [], 0, True
+            if batches or not emitted:
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                yield table.to_pandas(self_destruct=True, types_mapper=_STRING_TYPES_MAPPER)
+
+    @staticmethod
+    def _clean_columns(columns: pd.Index) -> pd.Index:
+        return columns.str.strip().str.lower().str.replace(' ', '_')
+
 
 class FMCSAFixedWidthParser(FMCSADataParser):
     """Parser for FMCSA fixed-width text files."""
@@ -193,9 +338,15 @@ class FMCSAFixedWidthParser(FMCSADataParser):
 class FMCSAInspectionParser(FMCSACSVParser):
     """Specialized parser for inspection data with food safety filtering."""
 
-    def parse_food_safety_violations(self) -> pd.DataFrame:
-        """Parse and filter for food safety related violations."""
-        df = self.parse_to_dataframe()
+    def parse_food_safety_violations(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Parse and filter for food safety related violations.
+
+        Args:
+            df: Inspections already parsed from this file; parsed here when omitted
+        """
+        if df is None:
+            df = self.parse_to_dataframe()
 
         # Filter for food safety violations
         food_safety_mask = df['violation_code'].str.contains(
@@ -217,9 +368,15 @@ class FMCSAInspectionParser(FMCSACSVParser):
         logger.info(f"Found {len(fsma_df)} food safety related violations")
         return fsma_df
 
-    def get_carrier_violation_summary(self) -> pd.DataFrame:
-        """Get summary of violations by carrier."""
-        df = self.parse_to_dataframe()
+    def get_carrier_violation_summary(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Get summary of violations by carrier.
+
+        Args:
+            df: Inspections already parsed from this file; parsed here when omitted
+        """
+        if df is None:
+            df = self.parse_to_dataframe()
 
         # Group by carrier and violation type
         summary = df.groupby(['dot_number', 'violation_code']).agg({
@@ -233,6 +390,59 @@ class FMCSAInspectionParser(FMCSACSVParser):
 class FMCSACensusParser(FMCSACSVParser):
     """Specialized parser for MCMIS Census data."""
 
+    dtypes = CENSUS_DTYPES
+
+    def parse_to_dataframe(self) -> pd.DataFrame:
+        """Parse the census and report rows failing DOT/state validation."""
+        df = super().parse_to_dataframe()
+
+        invalid_count = self._count_invalid(df)
+        if invalid_count:
+            logger.warning(f"{invalid_count} census rows failed DOT number/state validation")
+
+        return df
+
+    def parse_in_chunks(self, chunk_size: int = 500_000) -> Iterator[pd.DataFrame]:
+        """Parse the census in chunks, reporting rows failing DOT/state validation once at the end."""
+        invalid_count = 0
+        for chunk in super().parse_in_chunks(chunk_size):
+            invalid_count += self._count_invalid(chunk)
+            yield chunk
+
+        if invalid_count:
+            logger.warning(f"{invalid_count} census rows failed DOT number/state validation")
+
+    @staticmethod
+    def _count_invalid(df: pd.DataFrame) -> int:
+        """Rows whose DOT number or physical state fails validation."""
+        # One boolean mask per column instead of validating row by row
+        valid = pd.Series(True, index=df.index)
+        if 'dot_number' in df.columns:
+            valid &= validate_dot_series(df['dot_number'])
+        if 'phy_state' in df.columns:
+            valid &= validate_state_series(df['phy_state']) | df['phy_state'].isna()
+        return int((~valid).sum())
+
+    @functools.cached_property
+    def df(self) -> pd.DataFrame:
+        """Census frame parsed once and shared by repeated lookups."""
+        return self.parse_to_dataframe()
+
+    @functools.cached_property
+    def phy_state_upper(self) -> pd.Series:
+        """Uppercased phy_state, computed once so state filters reduce to an isin."""
+        state = self.df['phy_state']
+        if not isinstance(state.dtype, pd.CategoricalDtype):
+            return state.str.upper()
+
+        # Uppercase only the categories; 'tx' and 'TX' then share one code, so the
+        # result stays categorical and isin compares codes rather than strings
+        remap, upper = pd.factorize(state.cat.categories.astype(str).str.upper())
+        # Missing values (code -1) pick up the -1 appended at the end of the remap
+        codes = np.append(remap, -1)[state.cat.codes.to_numpy()]
+        return pd.Series(pd.Categorical.from_codes(codes, categories=upper),
+                         index=state.index, name=state.name)
+
     def filter_by_state(self, state_code: str) -> pd.DataFrame:
         """Filter carriers by state."""
         df = self.parse_to_dataframe()
@@ -241,8 +451,13 @@ class FMCSACensusParser(FMCSACSVParser):
     def filter_brokers(self) -> pd.DataFrame:
         """Filter for brokers only."""
         df = self.parse_to_dataframe()
+        return df[self.broker_mask(df)]
+
+    @staticmethod
+    def broker_mask(df: pd.DataFrame) -> pd.Series:
+        """Rows whose carrier operation marks them as brokers."""
         # Brokers typically have specific authority indicators
-        return df[df['carrier_operation'].str.contains('broker', case=False, na=False)]
+        return df['carrier_operation'].str.contains('broker', case=False, na=False)
 
     def filter_by_fleet_size(self, min_size: int = 0, max_size: Optional[int] = None) -> pd.DataFrame:
         """Filter by fleet size."""
@@ -265,16 +480,25 @@ class FMCSACensusParser(FMCSACSVParser):
     def filter_carriers(self) -> pd.DataFrame:
         """Filter for carriers only (exclude brokers)."""
         df = self.parse_to_dataframe()
+        return df[self.carrier_mask(df)]
+
+    @staticmethod
+    def carrier_mask(df: pd.DataFrame) -> pd.Series:
+        """Rows that are carriers, i.e. neither operation nor entity type mentions brokering."""
         broker_mask = (
             df['carrier_operation'].str.contains('broker', case=False, na=False) |
             df['entity_type'].str.contains('broker', case=False, na=False)
         )
-        return df[~broker_mask]
+        return ~broker_mask
 
     def filter_equipment_types(self, equipment_types: List[str]) -> pd.DataFrame:
         """Filter by equipment/cargo types (Reefers, Flatbeds, etc.)."""
         df = self.parse_to_dataframe()
+        return df[self.equipment_mask(df, equipment_types)]
 
+    @staticmethod
+    def equipment_mask(df: pd.DataFrame, equipment_types: List[str]) -> pd.Series:
+        """Rows whose equipment/cargo columns mention any of the given types."""
         # Equipment types might be in various columns
         equipment_columns = ['cargo_type', 'equipment_type', 'commodity_type', 'vehicle_type']
 
@@ -286,7 +510,7 @@ class FMCSACensusParser(FMCSACSVParser):
                     mask = df[col].str.contains(eq_type, case=False, na=False)
                     combined_mask |= mask
 
-        return df[combined_mask]
+        return combined_mask
 
     def find_new_companies(self, days_back: int = 30) -> pd.DataFrame:
         """Find newly registered companies."""
@@ -449,7 +673,7 @@ def get_parser_for_file(file_path: Path, **kwargs) -> FMCSADataParser:
     """
     file_ext = file_path.suffix.lower()
 
-    if file_ext == '.csv':
+    if file_ext in ('.csv', '.parquet'):
         # Determine if it's a specialized parser based on filename
         filename = file_path.name.lower()
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script to verify dot_number joins in merge_datasets.
+Malformed DOT numbers become missing keys, which must never match each other.
+"""
+
+import sys
+
+import pandas as pd
+
+from python_data_functions.main import _dot_numbers, _merge_on_dot
+
+
+def _frames():
+    """Census with 4 bad or empty DOT numbers and safety data with 2."""
+    census = pd.DataFrame({
+        'dot_number': _dot_numbers(pd.Series(['123', 'abc', '', '12x', None])),
+        'legal_name': ['a', 'b', 'c', 'd', 'e'],
+    })
+    safety = pd.DataFrame({
+        'dot_number': _dot_numbers(pd.Series(['123', 'zzz', ''])),
+        'safety_score': [1.0, 2.0, 3.0],
+    })
+    return census, safety
+
+
+def test_missing_dots_lookup():
+    """One row per DOT number: bad-DOT carriers get no safety data."""
+    census, safety = _frames()
+    merged = _merge_on_dot(census, safety, '_safety')
+
+    assert len(merged) == len(census)
+    assert merged['legal_name'].tolist() == census['legal_name'].tolist()
+    assert merged['safety_score'].iloc[0] == 1.0
+    assert merged['safety_score'].iloc[1:].isna().all()
+
+
+def test_missing_dots_fan_out():
+    """Repeated DOT numbers fan out, but missing keys still match nothing."""
+    census, safety = _frames()
+    merged = _merge_on_dot(census, pd.concat([safety, safety]), '_safety')
+
+    assert len(merged) == len(census) + 1
+    assert merged['legal_name'].tolist() == ['a', 'a', 'b', 'c', 'd', 'e']
+    assert merged['safety_score'].iloc[:2].tolist() == [1.0, 1.0]
+    assert merged['safety_score'].iloc[2:].isna().all()
+
+
+def main():
+    """Run all merge tests."""
+    print("🚛 FMCSA Data Functions - Merge Test Suite")
+    print("=" * 50)
+
+    failed = []
+    for test in (test_missing_dots_lookup, test_missing_dots_fan_out):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            failed.append(test.__name__)
+
+    print("\n" + "=" * 50)
+    if failed:
+        print(f"❌ {len(failed)} merge test(s) failed")
+        return False
+    print("🎉 All merge tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
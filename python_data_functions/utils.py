@@ -8,16 +8,24 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import re
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv  # multithreaded C++ CSV writer, used when installed
+except ImportError:
+    pa = pa_csv = None
 
 # Handle both relative and absolute imports
 try:
-    from .consts import VALIDATION_RULES
+    from .consts import VALIDATION_RULES, validate_dot_series
 except ImportError:
-    from consts import VALIDATION_RULES
+    from consts import VALIDATION_RULES, validate_dot_series
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for CSV exports; large writes amortize syscall overhead on big files
+_CSV_WRITE_BUFFER = 8 << 20
+
 
 class FMCSADataError(Exception):
     """Base exception for FMCSA data processing errors."""
@@ -52,9 +60,9 @@ def validate_dot_number(dot_number: str) -> bool:
     if not dot_number or not isinstance(dot_number, str):
         return False
 
-    # DOT numbers are 1-8 digits
-    pattern = VALIDATION_RULES["dot_number"]["pattern"]
-    return bool(re.match(pattern, dot_number.strip()))
+    # DOT numbers are 1-8 digits; same check as VALIDATION_RULES["dot_number"] without the regex engine
+    dot_number = dot_number.strip()
+    return dot_number.isdecimal() and len(dot_number) <= 8
 
 
 def validate_carrier_data(df: pd.DataFrame, required_fields: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -90,7 +98,7 @@ def validate_carrier_data(df: pd.DataFrame, required_fields: Optional[List[str]]
 
     # Validate DOT numbers if present
     if "dot_number" in df.columns:
-        invalid_dots = df["dot_number"].astype(str).apply(lambda x: not validate_dot_number(x))
+        invalid_dots = ~validate_dot_series(df["dot_number"])
         invalid_count = invalid_dots.sum()
 
         if invalid_count > 0:
@@ -332,6 +340,47 @@ def safe_merge_dataframes(left: pd.DataFrame, right: pd.DataFrame,
         raise
 
 
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write a DataFrame to CSV without its index.
+
+    Uses pyarrow's writer when pyarrow is installed and the columns convert
+    to Arrow, otherwise DataFrame.to_csv. The file is written beside path
+    through a large buffer and renamed into place, so a failed write never
+    leaves a truncated CSV at path.
+
+    Args:
+        df: DataFrame to write
+        path: Output CSV path
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    try:
+        with open(tmp_path, 'wb', buffering=_CSV_WRITE_BUFFER) as f:
+            if not _write_csv_arrow(df, f, path):
+                df.to_csv(f, index=False)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_csv_arrow(df: pd.DataFrame, f, path: Path) -> bool:
+    """Write df to the open file f with pyarrow's CSV writer; False if it cannot be used."""
+    if pa_csv is None:
+        return False
+    try:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), f)
+        return True
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        # e.g. object columns holding mixed types; drop anything already written
+        logger.debug(f"Falling back to pandas CSV writer for {path}: {e}")
+        f.seek(0)
+        f.truncate()
+        return False
+
+
 def export_to_multiple_formats(df: pd.DataFrame, base_path: Path,
                               formats: List[str] = None) -> Dict[str, Path]:
     """
@@ -355,7 +404,7 @@ def export_to_multiple_formats(df: pd.DataFrame, base_path: Path,
             output_path = base_path.parent / f"{base_path.stem}.{fmt}"
 
             if fmt == "csv":
-                df.to_csv(output_path, index=False)
+                write_csv(df, output_path)
             elif fmt == "json":
                 df.to_json(output_path, orient="records", date_format="iso")
             elif fmt == "parquet":